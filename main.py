@@ -1,6 +1,7 @@
 """Main entry point for the restoCompras scraper system."""
 
 import argparse
+import importlib.util
 import logging
 import sys
 from datetime import datetime
@@ -34,7 +35,7 @@ SCRAPER_REGISTRY = {
 
 def run_scraper(supplier_name: str, config_dir: str = 'configs', 
                 output_dir: str = 'output', log_dir: str = 'logs',
-                environment: str = 'dev') -> bool:
+                environment: str = 'dev', export_format: str = 'xlsx') -> bool:
     """
     Run scraper for a specific supplier.
     
@@ -44,12 +45,14 @@ def run_scraper(supplier_name: str, config_dir: str = 'configs',
         output_dir: Output directory for exports
         log_dir: Directory for log files
         environment: Environment to use ('dev' or 'prod'). Default is 'dev'.
+        export_format: Export file format ('xlsx', 'csv', 'json' or 'parquet')
         
     Returns:
         True if successful, False otherwise
     """
     # Set up logging with DEBUG level for file handler
     logger = setup_logger(log_dir=log_dir, level=logging.DEBUG)
+    api_client = None
     
     try:
         # Load configurations
@@ -157,15 +160,14 @@ def run_scraper(supplier_name: str, config_dir: str = 'configs',
             logger.info(f"Available scrapers: {', '.join(SCRAPER_REGISTRY.keys())}")
             return False
         
-        # Initialize scraper
-        scraper = scraper_class(supplier_config, api_client)
-        
-        # Run scraping process
-        logger.info("="*70)
-        logger.info(f"STARTING SCRAPE: {supplier_config['supplier_name']}")
-        logger.info("="*70)
-        
-        products = scraper.scrape()
+        # Initialize scraper; its strategy is closed as soon as scraping finishes
+        with scraper_class(supplier_config, api_client) as scraper:
+            # Run scraping process
+            logger.info("="*70)
+            logger.info(f"STARTING SCRAPE: {supplier_config['supplier_name']}")
+            logger.info("="*70)
+            
+            products = scraper.scrape()
         
         if not products:
             logger.warning("No products were successfully scraped")
@@ -174,13 +176,13 @@ def run_scraper(supplier_name: str, config_dir: str = 'configs',
         # Export results
         exporter = DataExporter(output_dir)
         
-        excel_file = exporter.export_to_excel(products, supplier_config['supplier_name'])
+        export_file = exporter.export(products, supplier_config['supplier_name'], format=export_format)
         
-        if excel_file:
+        if export_file:
             logger.info("="*70)
             logger.info("SCRAPING COMPLETED SUCCESSFULLY")
             logger.info(f"Total products: {len(products)}")
-            logger.info(f"Export file: {excel_file}")
+            logger.info(f"Export file: {export_file}")
             logger.info("="*70)
             return True
         else:
@@ -193,6 +195,9 @@ def run_scraper(supplier_name: str, config_dir: str = 'configs',
     except Exception as e:
         logger.error(f"Scraper failed with error: {e}", exc_info=True)
         return False
+    finally:
+        if api_client is not None:
+            api_client.close()
 
 
 def list_suppliers(config_dir: str = 'configs') -> None:
@@ -222,7 +227,8 @@ def list_suppliers(config_dir: str = 'configs') -> None:
 
 
 def run_all_scrapers(config_dir: str = 'configs', output_dir: str = 'output',
-                    log_dir: str = 'logs', environment: str = 'dev') -> Tuple[List[str], List[str]]:
+                    log_dir: str = 'logs', environment: str = 'dev',
+                    export_format: str = 'xlsx') -> Tuple[List[str], List[str]]:
     """
     Run scrapers for all available suppliers.
     
@@ -231,6 +237,7 @@ def run_all_scrapers(config_dir: str = 'configs', output_dir: str = 'output',
         output_dir: Output directory for exports
         log_dir: Directory for log files
         environment: Environment to use ('dev' or 'prod')
+        export_format: Export file format ('xlsx', 'csv', 'json' or 'parquet')
         
     Returns:
         Tuple of (successful_suppliers, failed_suppliers)
@@ -278,7 +285,8 @@ def run_all_scrapers(config_dir: str = 'configs', output_dir: str = 'output',
             config_dir=config_dir,
             output_dir=output_dir,
             log_dir=log_dir,
-            environment=environment
+            environment=environment,
+            export_format=export_format
         )
         
         if success:
@@ -402,8 +410,19 @@ Examples:
         help='Log directory (default: logs)'
     )
     
+    parser.add_argument(
+        '--export-format',
+        choices=['xlsx', 'csv', 'json', 'parquet'],
+        default='xlsx',
+        help='Export file format (default: xlsx)'
+    )
+    
     args = parser.parse_args()
     
+    # Parquet needs the optional pyarrow package; fail now rather than after scraping
+    if args.export_format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        parser.error("--export-format parquet requires pyarrow (pip install pyarrow)")
+    
     # Handle list command
     if args.list:
         list_suppliers(args.config_dir)
@@ -415,7 +434,8 @@ Examples:
             config_dir=args.config_dir,
             output_dir=args.output_dir,
             log_dir=args.log_dir,
-            environment=args.environment
+            environment=args.environment,
+            export_format=args.export_format
         )
         sys.exit(0 if not failed_suppliers else 1)
     
@@ -431,7 +451,8 @@ Examples:
         config_dir=args.config_dir,
         output_dir=args.output_dir,
         log_dir=args.log_dir,
-        environment=args.environment
+        environment=args.environment,
+        export_format=args.export_format
     )
     
     sys.exit(0 if success else 1)
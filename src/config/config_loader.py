@@ -3,7 +3,7 @@
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class ConfigLoader:
@@ -30,6 +30,41 @@ class ConfigLoader:
         
         self.logger.info(f"ConfigLoader initialized for environment: {environment}")
     
+    def _validate(self, config: Dict[str, Any], required: List[str], label: str) -> None:
+        """
+        Ensure all required fields are present in a parsed config.
+        
+        Args:
+            config: Parsed configuration dictionary
+            required: Field names that must be present
+            label: Config kind used in the error message (e.g. 'API')
+            
+        Raises:
+            ValueError: If any required field is missing
+        """
+        missing = [field for field in required if field not in config]
+        
+        if missing:
+            raise ValueError(f"{label} config missing required fields: {missing}")
+    
+    def _read_config(self, filepath: str, required: List[str], label: str) -> Dict[str, Any]:
+        """
+        Read and validate a JSON config file.
+        
+        Args:
+            filepath: Path to the JSON config file
+            required: Field names that must be present
+            label: Config kind used in error messages
+            
+        Returns:
+            Validated configuration dictionary
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        
+        self._validate(config, required, label)
+        return config
+    
     def load_api_config(self, config_file: Optional[str] = None) -> Dict[str, Any]:
         """
         Load API configuration based on environment.
@@ -58,15 +93,7 @@ class ConfigLoader:
         
         self.logger.info(f"Loading API config from {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        # Validate required fields
-        required_fields = ['auth_token']
-        missing = [field for field in required_fields if field not in config]
-        
-        if missing:
-            raise ValueError(f"API config missing required fields: {missing}")
+        config = self._read_config(filepath, ['auth_token'], 'API')
         
         self.logger.info(f"API config loaded successfully (environment: {self.environment})")
         return config
@@ -140,15 +167,8 @@ class ConfigLoader:
         
         self.logger.info(f"Loading supplier config from {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
         # Validate required fields (supplier_id and supplier_name removed - now from backend)
-        required_fields = ['scraping_strategy']
-        missing = [field for field in required_fields if field not in config]
-        
-        if missing:
-            raise ValueError(f"Supplier config missing required fields: {missing}")
+        config = self._read_config(filepath, ['scraping_strategy'], 'Supplier')
         
         # Log loading (supplier_name might not exist in config anymore)
         supplier_name_display = config.get('supplier_name', supplier_name)
@@ -2,9 +2,49 @@
 
 import requests
 import logging
-from typing import Optional, Dict, Any
-from urllib.parse import quote
+import os
+import re
+import shelve
+import threading
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..utils.json_utils import json_loads, json_dumps_pretty, json_encode
+
+
+# Response headers that may carry credentials and must not reach the logs
+_SENSITIVE_HEADERS = frozenset(['authorization', 'authentication', 'x-auth-token', 'token', 'set-cookie'])
+
+# Login response headers that may carry the token, most likely first
+# (response.headers is case-insensitive, so one spelling per name suffices)
+_TOKEN_HEADERS = ('Authorization', 'X-Auth-Token', 'Authentication', 'Token')
+
+# Login response body keys that may carry the token, most likely first
+_TOKEN_BODY_KEYS = ('token', 'access_token', 'accessToken', 'jwt', 'authToken')
+
+# Body keys whose values are redacted before logging
+_SENSITIVE_KEY_PATTERN = re.compile(r'token|jwt|auth|password', re.IGNORECASE)
+
+
+def _format_headers(headers: Mapping[str, str]) -> str:
+    """
+    Format headers one per line for debug logging, redacting credentials.
+    
+    Iterates the (case-insensitive) headers mapping in place instead of
+    copying it into a dict first.
+    
+    Args:
+        headers: Request or response headers
+        
+    Returns:
+        Multi-line string of "name: value" pairs
+    """
+    return "\n".join(
+        f"  {k}: {'***' if k.lower() in _SENSITIVE_HEADERS else v}" for k, v in headers.items()
+    )
 
 
 class APIClient:
@@ -27,17 +67,88 @@ class APIClient:
         self.login_endpoint = config.get('login_endpoint', '/login')
         self.search_endpoint = config.get('search_endpoint', '/api/products/search/best-match')
         self.item_endpoint = config.get('item_endpoint', '/api/item')
+        self.item_bulk_endpoint = config.get('item_bulk_endpoint', '/api/item/bulk')
         self.supplier_search_endpoint = config.get('supplier_search_endpoint', '/api/suppliers/search')
         self.supplier_delete_endpoint = config.get('supplier_delete_endpoint', '/api/supplier/{supplier_id}')
         self.timeout = config.get('timeout', 10)
+        self.max_workers = config.get('max_workers', 16)
         self.credentials = config.get('credentials', {})
+        
+        # Full endpoint URLs, built once instead of per request
+        self._login_url = f"{self.base_url}{self.login_endpoint}"
+        self._search_url = f"{self.base_url}{self.search_endpoint}"
+        self._item_url = f"{self.base_url}{self.item_endpoint}"
+        self._item_bulk_url = f"{self.base_url}{self.item_bulk_endpoint}"
+        
+        # Bulk posting is opt-in; also cleared once the backend answers 404/405 on it
+        self._bulk_supported = bool(config.get('use_bulk_endpoint', False))
+        self._supplier_search_url = f"{self.base_url}{self.supplier_search_endpoint}"
+        
         # Use the main logger instance instead of creating a separate one
         self.logger = logging.getLogger('restocompras_scraper')
         
+        # In-memory lookup caches: catalogs repeat the same queries across rows
+        self._search_cache: Dict[str, Optional[int]] = {}
+        self._supplier_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Optional on-disk {query: (etag, product_id)} store for conditional searches
+        self.etag_cache_dir = config.get('etag_cache_dir')
+        self._etag_cache: Optional[shelve.Shelf] = None
+        self._etag_lock = threading.Lock()
+        
+        # Created lazily by _get_search_pool()
+        self._search_pool: Optional[ThreadPoolExecutor] = None
+        self._search_pool_lock = threading.Lock()
+        
         self._headers = {
             'Authorization': f'Bearer {self.auth_token}',
             'Content-Type': 'application/json'
         }
+        self._recompute_safe_headers()
+        
+        # Shared session so all calls to base_url reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        # Transient failures are retried by urllib3. Connection errors are retried for
+        # every method; status/read retries stay on idempotent methods (not POST) so a
+        # slow item post is never duplicated in the backend.
+        retry = Retry(
+            total=config.get('max_retries', 3),
+            backoff_factor=config.get('retry_backoff_factor', 0.5),
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+    
+    def _parse_body(self, response: requests.Response) -> Optional[Any]:
+        """
+        Parse a response body as JSON exactly once.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Parsed JSON, or None if the body is empty or not valid JSON
+        """
+        if not response.content:
+            return None
+        try:
+            return json_loads(response.content)
+        except json.JSONDecodeError:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response body (text): %s", response.content[:2048].decode('utf-8', 'replace'))
+            return None
+    
+    def _recompute_safe_headers(self) -> None:
+        """Rebuild the redacted request headers used for debug logging."""
+        self._safe_headers = {
+            k: ('***' if k.lower() in ('authorization', 'x-auth-token') else v)
+            for k, v in self._headers.items()
+        }
+        self._safe_headers_json = json_dumps_pretty(self._safe_headers)
     
     def login(self) -> Optional[str]:
         """
@@ -69,50 +180,49 @@ class APIClient:
         Returns:
             JWT token string if login successful, None otherwise
         """
-        login_url = f"{self.base_url}{self.login_endpoint}"
+        login_url = self._login_url
         
         payload = {
             'name': name,
             'password': password
         }
         
-        self.logger.info(f"Attempting login for user: {name}")
+        self.logger.info("Attempting login for user: %s", name)
         
         # 📤 REQUEST LOGGING
-        self.logger.info(f"📤 POST {login_url}")
-        # self.logger.debug(f"📤 Request headers: {{'Content-Type': 'application/json'}}")
-        # self.logger.debug(f"📤 Request body: {payload}")
+        self.logger.info("📤 POST %s", login_url)
+        # self.logger.debug("📤 Request headers: {'Content-Type': 'application/json'}")
+        # self.logger.debug("📤 Request body: %s", payload)
         
         try:
-            response = requests.post(
+            # Login must not send a stale Authorization header
+            response = self._session.post(
                 login_url,
                 json=payload,
-                headers={'Content-Type': 'application/json'},
+                headers={'Authorization': None},
                 timeout=self.timeout
             )
             
             # 📥 RESPONSE LOGGING
-            self.logger.info(f"📥 Response status: {response.status_code}")
-            # self.logger.debug(f"📥 Response headers: {json.dumps(dict(response.headers), indent=2)}")
+            self.logger.info("📥 Response status: %s", response.status_code)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response headers:\n%s", _format_headers(response.headers))
+            
+            body = self._parse_body(response)
             
             # Log response body (sanitized for security)
-            try:
-                response_body = response.json()
-                # Create sanitized version for logging
-                sanitized_body = {}
-                if isinstance(response_body, dict):
-                    for key, value in response_body.items():
-                        if any(token_key in key.lower() for token_key in ['token', 'jwt', 'auth', 'password']):
+            if self.logger.isEnabledFor(logging.DEBUG) and body is not None:
+                if isinstance(body, dict):
+                    # Create sanitized version for logging
+                    sanitized_body = {}
+                    for key, value in body.items():
+                        if _SENSITIVE_KEY_PATTERN.search(key):
                             sanitized_body[key] = "***REDACTED***"
                         else:
                             sanitized_body[key] = value
-                    self.logger.debug(f"📥 Response body: {json.dumps(sanitized_body, indent=2)}")
+                    self.logger.debug("📥 Response body: %s", json_dumps_pretty(sanitized_body))
                 else:
-                    self.logger.debug(f"📥 Response body type: {type(response_body).__name__}")
-            except json.JSONDecodeError:
-                self.logger.debug(f"📥 Response body (text): {response.text[:200]}")
-            except Exception as e:
-                self.logger.debug(f"📥 Response body parsing error: {e}")
+                    self.logger.debug("📥 Response body type: %s", type(body).__name__)
             
             if response.status_code == 200:
                 # Extract token from response headers
@@ -120,27 +230,25 @@ class APIClient:
                 token = None
                 
                 # Try different common header names
-                for header_name in ['Authorization', 'authorization', 'Authentication', 'authentication', 
-                                   'x-auth-token', 'X-Auth-Token', 'token', 'Token']:
-                    if header_name in response.headers:
-                        token = response.headers[header_name]
+                for header_name in _TOKEN_HEADERS:
+                    token = response.headers.get(header_name)
+                    if token:
                         # Remove 'Bearer ' prefix if present
                         if token.startswith('Bearer '):
                             token = token[7:]
-                        self.logger.info(f"Token found in header '{header_name}'")
+                        self.logger.info("Token found in header '%s'", header_name)
                         break
                 
                 # If not in headers, check response body
                 if not token:
-                    try:
-                        data = response.json()
+                    if isinstance(body, dict):
                         # Try common JSON keys for token
-                        for key in ['token', 'access_token', 'accessToken', 'jwt', 'authToken']:
-                            if key in data:
-                                token = data[key]
-                                self.logger.info(f"Token found in response body key '{key}'")
+                        for key in _TOKEN_BODY_KEYS:
+                            if key in body:
+                                token = body[key]
+                                self.logger.info("Token found in response body key '%s'", key)
                                 break
-                    except json.JSONDecodeError:
+                    elif body is None:
                         self.logger.warning("Could not parse response body as JSON")
                 
                 if token:
@@ -148,28 +256,25 @@ class APIClient:
                     # Update the client's auth token and headers
                     self.auth_token = token
                     self._headers['Authorization'] = f'Bearer {token}'
+                    self._session.headers['Authorization'] = f'Bearer {token}'
+                    self._recompute_safe_headers()
                     return token
                 else:
                     self.logger.warning("⚠️ Login returned 200 but no token found in headers or body")
-                    self.logger.debug(f"📥 Available response headers: {list(response.headers.keys())}")
-                    try:
-                        response_data = response.json()
-                        available_keys = list(response_data.keys()) if isinstance(response_data, dict) else []
-                        self.logger.debug(f"📥 Available response body keys: {available_keys}")
-                    except:
-                        self.logger.debug(f"📥 Response body preview: {response.text[:500]}")
+                    self.logger.debug("📥 Available response headers: %s", list(response.headers.keys()))
+                    available_keys = list(body.keys()) if isinstance(body, dict) else []
+                    self.logger.debug("📥 Available response body keys: %s", available_keys)
                     return None
             else:
-                self.logger.error(f"❌ Login failed with status code: {response.status_code}")
-                try:
-                    error_data = response.json()
-                    self.logger.error(f"📥 Error response body: {json.dumps(error_data, indent=2)}")
-                except:
-                    self.logger.error(f"📥 Error response text: {response.text[:200]}")
+                self.logger.error("❌ Login failed with status code: %s", response.status_code)
+                if body is not None:
+                    self.logger.error("📥 Error response body: %s", json_dumps_pretty(body))
+                else:
+                    self.logger.error("📥 Error response text: %s", response.text[:200])
                 return None
                 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"🔌 Login request failed: {e}")
+            self.logger.error("🔌 Login request failed: %s", e)
             return None
     
     def fetch_supplier_details(self, email: str) -> Optional[Dict[str, Any]]:
@@ -185,28 +290,36 @@ class APIClient:
         Returns:
             Dictionary with supplier details if found, None otherwise
         """
-        search_url = f"{self.base_url}{self.supplier_search_endpoint}?email={(email)}"
+        cached = self._supplier_cache.get(email)
+        if cached is not None:
+            self.logger.debug("Supplier details for '%s' served from cache", email)
+            return cached
+        
+        search_url = self._supplier_search_url
         
-        self.logger.info(f"Fetching supplier details for: {email}")
+        self.logger.info("Fetching supplier details for: %s", email)
         
         # 📤 REQUEST LOGGING
-        self.logger.info(f"📤 GET {search_url}")
-        # self.logger.debug(f"📤 Request headers: {json.dumps({k: '***' if 'authorization' in k.lower() else v for k, v in self._headers.items()}, indent=2)}")
+        self.logger.info("📤 GET %s?email=%s", search_url, email)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📤 Request headers: %s", self._safe_headers_json)
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 search_url,
-                headers=self._headers,
+                params={'email': email},
                 timeout=self.timeout
             )
             
             # 📥 RESPONSE LOGGING
-            self.logger.info(f"📥 Response status: {response.status_code}")
-            # self.logger.debug(f"📥 Response headers: {json.dumps(dict(response.headers), indent=2)}")
+            self.logger.info("📥 Response status: %s", response.status_code)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response headers:\n%s", _format_headers(response.headers))
             
             if response.status_code == 200:
-                supplier_data = response.json()
-                self.logger.debug(f"📥 Response body: {json.dumps(supplier_data, indent=2)}")
+                supplier_data = json_loads(response.content)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("📥 Response body: %s", json_dumps_pretty(supplier_data))
                 
                 # Log supplier info with enhanced details
                 if isinstance(supplier_data, dict):
@@ -216,56 +329,62 @@ class APIClient:
                     supplier_status = supplier_data.get('status', 'N/A')
                     
                     if supplier_id:
-                        self.logger.info(f"✅ Supplier found - ID: {supplier_id}, Name: {supplier_name or 'N/A'}")
-                        self.logger.debug(f"📊 Supplier details - Email: {supplier_email}, Status: {supplier_status}")
+                        self.logger.info("✅ Supplier found - ID: %s, Name: %s", supplier_id, supplier_name or 'N/A')
+                        self.logger.debug("📊 Supplier details - Email: %s, Status: %s", supplier_email, supplier_status)
                     else:
-                        self.logger.warning(f"⚠️ Supplier data retrieved but no ID found")
-                        self.logger.debug(f"📥 Available keys: {list(supplier_data.keys())}")
+                        self.logger.warning("⚠️ Supplier data retrieved but no ID found")
+                        self.logger.debug("📥 Available keys: %s", list(supplier_data.keys()))
                     
+                    self._supplier_cache[email] = supplier_data
                     return supplier_data
                 elif isinstance(supplier_data, list) and len(supplier_data) > 0:
                     # If response is a list, take the first supplier
                     supplier = supplier_data[0]
                     supplier_id = supplier.get('id') or supplier.get('supplierId')
                     supplier_name = supplier.get('name') or supplier.get('supplierName')
-                    self.logger.info(f"✅ Supplier found (array response) - ID: {supplier_id}, Name: {supplier_name or 'N/A'}")
-                    self.logger.debug(f"📊 Response contains {len(supplier_data)} suppliers, using first one")
+                    self.logger.info("✅ Supplier found (array response) - ID: %s, Name: %s", supplier_id, supplier_name or 'N/A')
+                    self.logger.debug("📊 Response contains %s suppliers, using first one", len(supplier_data))
+                    self._supplier_cache[email] = supplier
                     return supplier
                 else:
-                    self.logger.warning(f"⚠️ Unexpected supplier data format: {type(supplier_data).__name__}")
-                    self.logger.debug(f"📥 Raw response: {json.dumps(supplier_data, indent=2)}")
+                    self.logger.warning("⚠️ Unexpected supplier data format: %s", type(supplier_data).__name__)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("📥 Raw response: %s", json_dumps_pretty(supplier_data))
                     return supplier_data
             elif response.status_code == 404:
-                self.logger.warning(f"❌ Supplier not found for email: {email}")
+                self.logger.warning("❌ Supplier not found for email: %s", email)
                 try:
-                    error_body = response.json()
-                    self.logger.debug(f"📥 404 Response body: {json.dumps(error_body, indent=2)}")
+                    error_body = json_loads(response.content)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("📥 404 Response body: %s", json_dumps_pretty(error_body))
                 except:
-                    self.logger.debug(f"📥 404 Response text: {response.text}")
+                    self.logger.debug("📥 404 Response text: %s", response.text)
                 return None
             else:
-                self.logger.error(f"❌ Failed to fetch supplier details - Status: {response.status_code}")
+                self.logger.error("❌ Failed to fetch supplier details - Status: %s", response.status_code)
                 try:
-                    error_data = response.json()
-                    self.logger.error(f"📥 Error response body: {json.dumps(error_data, indent=2)}")
+                    error_data = json_loads(response.content)
+                    self.logger.error("📥 Error response body: %s", json_dumps_pretty(error_data))
                 except:
-                    self.logger.error(f"📥 Error response text: {response.text[:200]}")
+                    self.logger.error("📥 Error response text: %s", response.text[:200])
                 return None
                 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"🔌 Supplier details request failed for '{email}': {e}")
+            self.logger.error("🔌 Supplier details request failed for '%s': %s", email, e)
             return None
         except json.JSONDecodeError as e:
-            self.logger.error(f"📥 Invalid JSON response for supplier '{email}': {e}")
-            self.logger.debug(f"📥 Raw response text: {response.text[:500]}")
+            self.logger.error("📥 Invalid JSON response for supplier '%s': %s", email, e)
+            self.logger.debug("📥 Raw response text: %s", response.text[:500])
             return None
     
     def fetch_product_id(self, product_name: str) -> Optional[int]:
         """
         Fetch product ID using dual-strategy search.
         
-        First tries full product name, then falls back to shortened name
-        (first two words) if the initial search fails.
+        Searches the full product name and the shortened name (first two
+        words) concurrently; the full-name result wins when both match, so
+        a miss costs one round-trip instead of two. Names whose full-name
+        search is already cached skip the speculative short search.
         
         Args:
             product_name: Name of the product to search for
@@ -273,59 +392,160 @@ class APIClient:
         Returns:
             Product ID if found, None otherwise
         """
-        # Strategy 1: Full product name
-        product_id = self._search_product(product_name)
-        if product_id is not None:
-            return product_id
+        words = product_name.split()
+        short_name = " ".join(words[:2]) if len(words) > 2 else None
+        short_future = None
+        
+        full_key = product_name.strip().lower()
+        if full_key in self._search_cache:
+            # Strategy 1 already answered; only a cached miss needs strategy 2
+            product_id = self._search_cache[full_key]
+            if product_id is not None:
+                return product_id
+        else:
+            # Strategy 2 runs in the background while strategy 1 runs here
+            if short_name is not None:
+                short_future = self._get_search_pool().submit(self._search_product, short_name)
+            
+            # Strategy 1: Full product name
+            product_id = self._search_product(product_name)
+            if product_id is not None:
+                if short_future is not None:
+                    short_future.cancel()
+                return product_id
         
         # Strategy 2: Shortened name (first two words)
-        words = product_name.split()
-        if len(words) >= 2:
-            short_name = " ".join(words[:2])
+        if short_name is not None:
             self.logger.warning(
-                f"First search failed for '{product_name}', "
-                f"trying shortened name: '{short_name}'"
+                "First search failed for '%s', using shortened name: '%s'",
+                product_name, short_name
             )
-            product_id = self._search_product(short_name)
+            if short_future is not None:
+                product_id = short_future.result()
+            else:
+                product_id = self._search_product(short_name)
             if product_id is not None:
                 return product_id
         
-        self.logger.warning(f"No product ID found for '{product_name}' (both strategies failed)")
+        self.logger.warning("No product ID found for '%s' (both strategies failed)", product_name)
         return None
     
+    def _get_search_pool(self) -> ThreadPoolExecutor:
+        """Return the executor used for fallback searches, creating it on first use."""
+        if self._search_pool is None:
+            with self._search_pool_lock:
+                if self._search_pool is None:
+                    self._search_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._search_pool
+    
+    def fetch_product_ids(self, product_names: List[str]) -> List[Optional[int]]:
+        """
+        Fetch product IDs for many names concurrently.
+        
+        Lookups are network-bound, so they run on a bounded thread pool
+        sharing the client's connection pool.
+        
+        Args:
+            product_names: Names of the products to search for
+            
+        Returns:
+            Product IDs (or None) in the same order as product_names
+        """
+        if not product_names:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.fetch_product_id, product_names))
+    
+    def _get_etag_entry(self, cache_key: str) -> Optional[Tuple[str, Optional[int]]]:
+        """
+        Look up the stored (etag, product_id) pair for a search query.
+        
+        The shelf is opened lazily and only when 'etag_cache_dir' is configured.
+        
+        Args:
+            cache_key: Normalized search query
+            
+        Returns:
+            Tuple of (etag, product_id) if known, None otherwise
+        """
+        if not self.etag_cache_dir:
+            return None
+        
+        with self._etag_lock:
+            if self._etag_cache is None:
+                os.makedirs(self.etag_cache_dir, exist_ok=True)
+                self._etag_cache = shelve.open(os.path.join(self.etag_cache_dir, 'search.shelf'))
+            return self._etag_cache.get(cache_key)
+    
+    def _store_etag_entry(self, cache_key: str, etag: Optional[str], product_id: Optional[int]) -> None:
+        """
+        Persist the ETag of a successful search response.
+        
+        Args:
+            cache_key: Normalized search query
+            etag: ETag response header value (ignored if missing)
+            product_id: Product ID resolved by the response
+        """
+        if not etag or self._etag_cache is None:
+            return
+        
+        with self._etag_lock:
+            self._etag_cache[cache_key] = (etag, product_id)
+    
     def _search_product(self, query: str) -> Optional[int]:
         """
         Perform actual API search request.
         
+        Successful responses (including "no match") are cached by normalized
+        query; transport and JSON errors are not, so they can be retried.
+        When an ETag was stored for the query, the request is conditional and
+        a 304 response returns the stored ID without parsing a body.
+        
         Args:
             query: Search query string
             
         Returns:
             Product ID if found, None otherwise
         """
-        search_url = f"{self.base_url}{self.search_endpoint}?query={quote(query)}"
+        cache_key = query.strip().lower()
+        if cache_key in self._search_cache:
+            self.logger.debug("🔍 Cache hit for product: '%s'", query)
+            return self._search_cache[cache_key]
         
         # 📤 REQUEST LOGGING
-        self.logger.info(f"🔍 Searching for product: '{query}'")
-        self.logger.info(f"📤 GET {search_url}")
-        # self.logger.debug(f"📤 Request headers: {json.dumps({k: '***' if 'authorization' in k.lower() else v for k, v in self._headers.items()}, indent=2)}")
-        # self.logger.debug(f"📤 Query parameters: {{'query': query}}")
+        self.logger.info("🔍 Searching for product: '%s'", query)
+        self.logger.info("📤 GET %s?query=%s", self._search_url, query)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📤 Request headers: %s", self._safe_headers_json)
+        # self.logger.debug("📤 Query parameters: {'query': query}")
+        
+        etag_entry = self._get_etag_entry(cache_key)
         
         try:
-            response = requests.get(
-                search_url,
-                headers=self._headers,
+            response = self._session.get(
+                self._search_url,
+                params={'query': query},
+                headers={'If-None-Match': etag_entry[0]} if etag_entry else None,
                 timeout=self.timeout
             )
             
             # 📥 RESPONSE LOGGING
-            self.logger.info(f"📥 Response status: {response.status_code}")
-            # self.logger.debug(f"📥 Response headers: {json.dumps(dict(response.headers), indent=2)}")
+            self.logger.info("📥 Response status: %s", response.status_code)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response headers:\n%s", _format_headers(response.headers))
+            
+            if response.status_code == 304 and etag_entry:
+                self.logger.info("✅ Search for '%s' not modified, using stored product ID %s", query, etag_entry[1])
+                self._search_cache[cache_key] = etag_entry[1]
+                return etag_entry[1]
             
             response.raise_for_status()
+            etag = response.headers.get('ETag')
             
-            data = response.json()
-            self.logger.debug(f"📥 Response body: {json.dumps(data, indent=2)}")
+            data = json_loads(response.content)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response body: %s", json_dumps_pretty(data))
             
             # Check if response contains productId
             if isinstance(data, dict) and 'productId' in data and data['productId'] is not None:
@@ -333,29 +553,34 @@ class APIClient:
                 product_id = data['productId']
                 product_name = data.get('name', 'N/A')
                 product_category = data.get('category', 'N/A')
-                self.logger.info(f"✅ Found product ID {product_id} for '{query}'")
-                self.logger.debug(f"📊 Product details - Name: {product_name}, Category: {product_category}")
+                self.logger.info("✅ Found product ID %s for '%s'", product_id, query)
+                self.logger.debug("📊 Product details - Name: %s, Category: %s", product_name, product_category)
+                self._search_cache[cache_key] = product_id
+                self._store_etag_entry(cache_key, etag, product_id)
                 return product_id
             
-            self.logger.warning(f"⚠️ No productId in response for '{query}'")
+            self.logger.warning("⚠️ No productId in response for '%s'", query)
             if isinstance(data, dict):
                 available_keys = list(data.keys())
-                self.logger.debug(f"📥 Available response keys: {available_keys}")
+                self.logger.debug("📥 Available response keys: %s", available_keys)
+            self._search_cache[cache_key] = None
+            self._store_etag_entry(cache_key, etag, None)
             return None
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"❌ API search failed for '{query}': {e}")
+            self.logger.error("❌ API search failed for '%s': %s", query, e)
             if hasattr(e, 'response') and e.response is not None:
-                self.logger.debug(f"📥 Error response status: {e.response.status_code}")
+                self.logger.debug("📥 Error response status: %s", e.response.status_code)
                 try:
-                    error_body = e.response.json()
-                    self.logger.debug(f"📥 Error response body: {json.dumps(error_body, indent=2)}")
+                    error_body = json_loads(e.response.content)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("📥 Error response body: %s", json_dumps_pretty(error_body))
                 except:
-                    self.logger.debug(f"📥 Error response text: {e.response.text[:200]}")
+                    self.logger.debug("📥 Error response text: %s", e.response.text[:200])
             return None
         except json.JSONDecodeError as e:
-            self.logger.error(f"📥 Invalid JSON response for '{query}': {e}")
-            self.logger.debug(f"📥 Raw response text: {response.text[:200]}")
+            self.logger.error("📥 Invalid JSON response for '%s': %s", query, e)
+            self.logger.debug("📥 Raw response text: %s", response.text[:200])
             return None
     
     def post_item(self, product_data: Dict[str, Any]) -> bool:
@@ -368,88 +593,187 @@ class APIClient:
         Returns:
             True if successful, False otherwise
         """
-        post_url = f"{self.base_url}{self.item_endpoint}"
+        post_url = self._item_url
         
         # Build payload from product data
-        payload = {
-            'name': product_data['name'],
-            'description': product_data.get('description', product_data['name']),
-            'price': product_data['price'],
-            'image': product_data.get('image', ''),
-            'productId': product_data['productId'],
-            'unit': product_data['unit'],
-            'quantity': product_data['quantity'],
-            'supplierId': product_data['supplierId'],
-            'brand': product_data['brand']
-        }
+        payload = self._build_item_payload(product_data)
         
         # 📤 REQUEST LOGGING
-        self.logger.info(f"📦 Posting product: '{product_data['name']}'")
-        self.logger.info(f"📤 POST {post_url}")
-        # self.logger.debug(f"📤 Request headers: {json.dumps({k: '***' if 'authorization' in k.lower() else v for k, v in self._headers.items()}, indent=2)}")
-        # self.logger.debug(f"📤 Request body: {json.dumps(payload, indent=2)}")
+        self.logger.info("📦 Posting product: '%s'", product_data['name'])
+        self.logger.info("📤 POST %s", post_url)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📤 Request headers: %s", self._safe_headers_json)
+        # self.logger.debug("📤 Request body: %s", json_dumps_pretty(payload))
         
         try:
-            response = requests.post(
+            # Body is pre-encoded (orjson when available); the session sends Content-Type
+            response = self._session.post(
                 post_url,
-                json=payload,
-                headers=self._headers,
+                data=json_encode(payload),
                 timeout=self.timeout
             )
             
             # 📥 RESPONSE LOGGING
-            self.logger.info(f"📥 Response status: {response.status_code}")
-            # self.logger.debug(f"📥 Response headers: {json.dumps(dict(response.headers), indent=2)}")
+            self.logger.info("📥 Response status: %s", response.status_code)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response headers:\n%s", _format_headers(response.headers))
+            
+            # Parse once; both the success and the error branch read it
+            response_data = self._parse_body(response)
+            
+            if not response.ok:
+                self.logger.error(
+                    "❌ API post failed for '%s' - Status: %s",
+                    product_data['name'], response.status_code
+                )
+                if response_data is not None:
+                    self.logger.error("📥 Error response body: %s", json_dumps_pretty(response_data))
+                    
+                    # Extract specific error information
+                    if isinstance(response_data, dict):
+                        error_message = response_data.get('message') or response_data.get('error')
+                        error_code = response_data.get('code') or response_data.get('errorCode')
+                        if error_message:
+                            self.logger.error("💬 Error message: %s", error_message)
+                        if error_code:
+                            self.logger.error("🔢 Error code: %s", error_code)
+                else:
+                    self.logger.error("📥 Error response text: %s", response.text[:200])
+                return False
             
             # Log response details
-            try:
-                response_data = response.json()
-                self.logger.debug(f"📥 Response body: {json.dumps(response_data, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG) and response_data is not None:
+                self.logger.debug("📥 Response body: %s", json_dumps_pretty(response_data))
                 
                 # Extract useful information from response
                 if isinstance(response_data, dict):
                     item_id = response_data.get('id') or response_data.get('itemId')
                     created_at = response_data.get('createdAt') or response_data.get('created_at')
                     if item_id:
-                        self.logger.debug(f"📊 Created item ID: {item_id}")
+                        self.logger.debug("📊 Created item ID: %s", item_id)
                     if created_at:
-                        self.logger.debug(f"📊 Created at: {created_at}")
-                        
-            except json.JSONDecodeError:
-                self.logger.debug(f"📥 Response body (text): {response.text[:200]}")
-            
-            response.raise_for_status()
+                        self.logger.debug("📊 Created at: %s", created_at)
             
             self.logger.info(
-                f"✅ Successfully posted '{product_data['name']}' "
-                f"(Product ID: {product_data['productId']}, Supplier ID: {product_data['supplierId']})"
+                "✅ Successfully posted '%s' (Product ID: %s, Supplier ID: %s)",
+                product_data['name'], product_data['productId'], product_data['supplierId']
             )
             return True
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"❌ API post failed for '{product_data['name']}': {e}")
+            self.logger.error("❌ API post failed for '%s': %s", product_data['name'], e)
+            return False
+    
+    @staticmethod
+    def _build_item_payload(product_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map product data to the item payload expected by the backend.
+        
+        Args:
+            product_data: Product data dictionary with all required fields
             
-            # Try to log error response with enhanced details
-            if hasattr(e, 'response') and e.response is not None:
-                self.logger.error(f"📥 Error response status: {e.response.status_code}")
-                # self.logger.debug(f"📥 Error response headers: {json.dumps(dict(e.response.headers), indent=2)}")
-                try:
-                    error_data = e.response.json()
-                    self.logger.error(f"📥 Error response body: {json.dumps(error_data, indent=2)}")
-                    
-                    # Extract specific error information
-                    if isinstance(error_data, dict):
-                        error_message = error_data.get('message') or error_data.get('error')
-                        error_code = error_data.get('code') or error_data.get('errorCode')
-                        if error_message:
-                            self.logger.error(f"💬 Error message: {error_message}")
-                        if error_code:
-                            self.logger.error(f"🔢 Error code: {error_code}")
-                            
-                except:
-                    self.logger.error(f"📥 Error response text: {e.response.text[:200]}")
+        Returns:
+            Item payload dictionary
+        """
+        return {
+            'name': product_data['name'],
+            'description': product_data.get('description', product_data['name']),
+            'price': product_data['price'],
+            'image': product_data.get('image', ''),
+            'productId': product_data['productId'],
+            'unit': product_data['unit'],
+            'quantity': product_data['quantity'],
+            'supplierId': product_data['supplierId'],
+            'brand': product_data['brand']
+        }
+    
+    def post_items_bulk(self, products: List[Dict[str, Any]], chunk_size: int = 100) -> List[bool]:
+        """
+        Post product items in chunks to the bulk item endpoint.
+        
+        Only used when the API config sets 'use_bulk_endpoint'; otherwise
+        this is post_items().
+        
+        If the backend does not expose the bulk endpoint (404/405), the
+        remaining products are posted one by one with post_items(), and
+        later calls go straight to post_items(). A chunk that fails for any
+        other reason (error status or request exception) is retried item by
+        item with post_items(), so one rejected product doesn't fail the
+        rest of its chunk.
+        
+        Args:
+            products: Product data dictionaries with all required fields
+            chunk_size: Number of items sent per request
             
-            return False
+        Returns:
+            Success flags in the same order as products
+        """
+        if not products:
+            return []
+        
+        if not self._bulk_supported:
+            return self.post_items(products)
+        
+        results: List[bool] = []
+        bulk_url = self._item_bulk_url
+        self.logger.info("📦 Posting %s products in chunks of %s", len(products), chunk_size)
+        self.logger.info("📤 POST %s", bulk_url)
+        
+        for start in range(0, len(products), chunk_size):
+            chunk = products[start:start + chunk_size]
+            payloads = [self._build_item_payload(product) for product in chunk]
+            
+            try:
+                response = self._session.post(
+                    bulk_url,
+                    data=json_encode(payloads),
+                    timeout=self.timeout * 3
+                )
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(
+                    "⚠️ Bulk post failed for items %s-%s: %s, retrying individually",
+                    start, start + len(chunk) - 1, e
+                )
+                results.extend(self.post_items(chunk))
+                continue
+            
+            if response.status_code in (404, 405):
+                self.logger.warning(
+                    "⚠️ Bulk endpoint unavailable (status %s), posting remaining %s items individually",
+                    response.status_code, len(products) - start
+                )
+                self._bulk_supported = False
+                results.extend(self.post_items(products[start:]))
+                break
+            
+            if response.ok:
+                results.extend([True] * len(chunk))
+            else:
+                self.logger.warning(
+                    "⚠️ Bulk post failed for items %s-%s - Status: %s, Response: %s, retrying individually",
+                    start, start + len(chunk) - 1, response.status_code, response.text[:200]
+                )
+                results.extend(self.post_items(chunk))
+        
+        posted = sum(results)
+        self.logger.info("✅ Bulk post finished - Posted: %s, Failed: %s", posted, len(results) - posted)
+        return results
+    
+    def post_items(self, products: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Post many product items concurrently.
+        
+        Args:
+            products: Product data dictionaries with all required fields
+            
+        Returns:
+            Success flags in the same order as products
+        """
+        if not products:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.post_item, products))
     
     def delete_supplier_items(self, supplier_id: int) -> bool:
         """
@@ -468,27 +792,29 @@ class APIClient:
         endpoint = self.supplier_delete_endpoint.format(supplier_id=supplier_id)
         delete_url = f"{self.base_url}{endpoint}"
         
-        self.logger.info(f"🗑️  Cleaning database for supplier ID: {supplier_id}")
+        self.logger.info("🗑️  Cleaning database for supplier ID: %s", supplier_id)
         
         # 📤 REQUEST LOGGING
-        self.logger.info(f"📤 DELETE {delete_url}")
-        # self.logger.debug(f"📤 Request headers: {json.dumps({k: '***' if 'authorization' in k.lower() else v for k, v in self._headers.items()}, indent=2)}")
+        self.logger.info("📤 DELETE %s", delete_url)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📤 Request headers: %s", self._safe_headers_json)
         
         try:
-            response = requests.delete(
+            response = self._session.delete(
                 delete_url,
-                headers=self._headers,
                 timeout=self.timeout
             )
             
             # 📥 RESPONSE LOGGING
-            self.logger.info(f"📥 Response status: {response.status_code}")
-            # self.logger.debug(f"📥 Response headers: {json.dumps(dict(response.headers), indent=2)}")
+            self.logger.info("📥 Response status: %s", response.status_code)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("📥 Response headers:\n%s", _format_headers(response.headers))
             
             # Log response details
             try:
-                response_data = response.json()
-                self.logger.debug(f"📥 Response body: {json.dumps(response_data, indent=2)}")
+                response_data = json_loads(response.content)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("📥 Response body: %s", json_dumps_pretty(response_data))
                 
                 # Extract useful information from response
                 if isinstance(response_data, dict):
@@ -496,41 +822,42 @@ class APIClient:
                     message = response_data.get('message') or response_data.get('msg')
                     
                     if deleted_count is not None:
-                        self.logger.info(f"📊 Deleted {deleted_count} items")
+                        self.logger.info("📊 Deleted %s items", deleted_count)
                     if message:
-                        self.logger.info(f"💬 Server message: {message}")
+                        self.logger.info("💬 Server message: %s", message)
                         
             except json.JSONDecodeError:
-                self.logger.debug(f"📥 Response body (text): {response.text[:200]}")
+                self.logger.debug("📥 Response body (text): %s", response.text[:200])
             
             # Consider 200, 204 (No Content), and 404 (no items to delete) as success
             if response.status_code in [200, 204, 404]:
                 if response.status_code == 404:
                     self.logger.info("✅ No items found to delete (supplier has no items)")
                 else:
-                    self.logger.info(f"✅ Successfully cleaned database for supplier ID: {supplier_id}")
+                    self.logger.info("✅ Successfully cleaned database for supplier ID: %s", supplier_id)
                 return True
             else:
-                self.logger.error(f"❌ Failed to delete items - Status: {response.status_code}")
+                self.logger.error("❌ Failed to delete items - Status: %s", response.status_code)
                 try:
-                    error_data = response.json()
-                    self.logger.error(f"📥 Error response body: {json.dumps(error_data, indent=2)}")
+                    error_data = json_loads(response.content)
+                    self.logger.error("📥 Error response body: %s", json_dumps_pretty(error_data))
                 except:
-                    self.logger.error(f"📥 Error response text: {response.text[:200]}")
+                    self.logger.error("📥 Error response text: %s", response.text[:200])
                 return False
                 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"🔌 Delete request failed for supplier ID {supplier_id}: {e}")
+            self.logger.error("🔌 Delete request failed for supplier ID %s: %s", supplier_id, e)
             
             # Try to log error response with enhanced details
             if hasattr(e, 'response') and e.response is not None:
-                self.logger.error(f"📥 Error response status: {e.response.status_code}")
-                # self.logger.debug(f"📥 Error response headers: {json.dumps(dict(e.response.headers), indent=2)}")
+                self.logger.error("📥 Error response status: %s", e.response.status_code)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("📥 Error response headers:\n%s", _format_headers(e.response.headers))
                 try:
-                    error_data = e.response.json()
-                    self.logger.error(f"📥 Error response body: {json.dumps(error_data, indent=2)}")
+                    error_data = json_loads(e.response.content)
+                    self.logger.error("📥 Error response body: %s", json_dumps_pretty(error_data))
                 except:
-                    self.logger.error(f"📥 Error response text: {e.response.text[:200]}")
+                    self.logger.error("📥 Error response text: %s", e.response.text[:200])
             
             return False
     
@@ -543,4 +870,19 @@ class APIClient:
         """
         self.auth_token = new_token
         self._headers['Authorization'] = f'Bearer {new_token}'
+        self._session.headers['Authorization'] = f'Bearer {new_token}'
+        self._recompute_safe_headers()
         self.logger.info("🔑 Auth token updated successfully")
+    
+    def close(self) -> None:
+        """Close the HTTP session and persist the ETag store, if open."""
+        if self._search_pool is not None:
+            self._search_pool.shutdown(wait=True, cancel_futures=True)
+            self._search_pool = None
+        
+        self._session.close()
+        
+        with self._etag_lock:
+            if self._etag_cache is not None:
+                self._etag_cache.close()
+                self._etag_cache = None
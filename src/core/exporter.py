@@ -1,17 +1,54 @@
 """Data export utilities for saving scraped data."""
 
-import pandas as pd
+import csv
 import logging
 import os
 from typing import List, Dict, Any
 from datetime import datetime
+from types import MappingProxyType
+
+from ..utils.json_utils import json_dump_bytes
+
+
+# Export column order
+COLUMN_ORDER = (
+    'name',
+    'brand',
+    'description',
+    'price',
+    'image',
+    'productId',
+    'unit',
+    'quantity',
+    'supplierId'
+)
+
+# Column headers in Spanish for consistency with original (read-only)
+COLUMN_MAPPING = MappingProxyType({
+    'name': 'Nombre',
+    'brand': 'Marca',
+    'description': 'Descripción',
+    'price': 'Precio',
+    'image': 'Imagen',
+    'productId': 'Producto ID',
+    'unit': 'Unidad',
+    'quantity': 'Cantidad',
+    'supplierId': 'supplierId'
+})
+
+# Parquet columns kept numeric; the rest are stored as text like the CSV export,
+# since suppliers mix str/int/float quantities and pyarrow rejects mixed columns
+_PARQUET_NUMERIC_COLUMNS = frozenset({'price', 'supplierId'})
+
+# Characters Excel rejects in sheet titles
+_SHEET_TITLE_TABLE = str.maketrans({c: '_' for c in '[]:*?/\\'})
 
 
 class DataExporter:
     """
     Handles exporting scraped data to various formats.
     
-    Currently supports Excel export with standardized column structure.
+    Supports Excel, CSV, JSON and Parquet export with standardized column structure.
     """
     
     def __init__(self, output_dir: str = 'output'):
@@ -27,6 +64,65 @@ class DataExporter:
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
     
+    def _build_filepath(self, supplier_name: str, extension: str) -> str:
+        """
+        Build a timestamped export path for a supplier.
+        
+        Args:
+            supplier_name: Name of supplier (for filename)
+            extension: File extension without the dot
+            
+        Returns:
+            Path inside the output directory
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        safe_supplier_name = supplier_name.lower().replace(' ', '_')
+        return os.path.join(self.output_dir, f"{safe_supplier_name}_export_{timestamp}.{extension}")
+    
+    @staticmethod
+    def _write_sheet(sheet, products: List[Dict[str, Any]]) -> None:
+        """
+        Write the header and product rows to a write-only worksheet.
+        
+        Args:
+            sheet: openpyxl write-only worksheet
+            products: List of product dictionaries
+        """
+        # Only include columns that appear in at least one product
+        columns = [col for col in COLUMN_ORDER if any(col in product for product in products)]
+        sheet.append([COLUMN_MAPPING[col] for col in columns])
+        
+        for product in products:
+            sheet.append([product.get(col) for col in columns])
+    
+    def export(self, products: List[Dict[str, Any]], supplier_name: str,
+               format: str = 'xlsx') -> str:
+        """
+        Export products in the requested format.
+        
+        Args:
+            products: List of product dictionaries
+            supplier_name: Name of supplier (for filename)
+            format: One of 'xlsx', 'csv', 'json' or 'parquet'
+            
+        Returns:
+            Path to the created file, or empty string on failure
+            
+        Raises:
+            ValueError: If format is not supported
+        """
+        exporters = {
+            'xlsx': self.export_to_excel,
+            'csv': self.export_to_csv,
+            'json': self.export_to_json,
+            'parquet': self.export_to_parquet,
+        }
+        
+        if format not in exporters:
+            raise ValueError(f"Unsupported export format: {format}")
+        
+        return exporters[format](products, supplier_name)
+    
     def export_to_excel(self, products: List[Dict[str, Any]], 
                        supplier_name: str) -> str:
         """
@@ -44,49 +140,16 @@ class DataExporter:
             return ""
         
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame(products)
-            
-            # Define column order
-            column_order = [
-                'name',
-                'brand',
-                'description',
-                'price',
-                'image',
-                'productId',
-                'unit',
-                'quantity',
-                'supplierId'
-            ]
-            
-            # Reorder columns (only include existing ones)
-            existing_columns = [col for col in column_order if col in df.columns]
-            df = df[existing_columns]
-            
-            # Rename columns to Spanish for consistency with original
-            column_mapping = {
-                'name': 'Nombre',
-                'brand': 'Marca',
-                'description': 'Descripción',
-                'price': 'Precio',
-                'image': 'Imagen',
-                'productId': 'Producto ID',
-                'unit': 'Unidad',
-                'quantity': 'Cantidad',
-                'supplierId': 'supplierId'
-            }
-            
-            df.rename(columns=column_mapping, inplace=True)
+            from openpyxl import Workbook
+            
+            workbook = Workbook(write_only=True)
+            self._write_sheet(workbook.create_sheet('Sheet1'), products)
             
             # Generate filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            safe_supplier_name = supplier_name.lower().replace(' ', '_')
-            filename = f"{safe_supplier_name}_export_{timestamp}.xlsx"
-            filepath = os.path.join(self.output_dir, filename)
+            filepath = self._build_filepath(supplier_name, 'xlsx')
             
             # Write to Excel
-            df.to_excel(filepath, index=False, engine='openpyxl')
+            workbook.save(filepath)
             
             self.logger.info(f"Exported {len(products)} products to {filepath}")
             return filepath
@@ -95,6 +158,49 @@ class DataExporter:
             self.logger.error(f"Failed to export to Excel: {e}", exc_info=True)
             return ""
     
+    def export_many(self, supplier_products: Dict[str, List[Dict[str, Any]]]) -> str:
+        """
+        Export several suppliers into one Excel workbook, one sheet each.
+        
+        Creating and saving a single workbook avoids paying the openpyxl
+        workbook setup and save cost once per supplier.
+        
+        Args:
+            supplier_products: Mapping of supplier name to its product list
+            
+        Returns:
+            Path to the created Excel file
+        """
+        supplier_products = {name: products for name, products in supplier_products.items() if products}
+        
+        if not supplier_products:
+            self.logger.warning("No products to export")
+            return ""
+        
+        try:
+            from openpyxl import Workbook
+            
+            workbook = Workbook(write_only=True)
+            total = 0
+            
+            for supplier_name, products in supplier_products.items():
+                # Excel sheet titles are limited to 31 chars and cannot contain []:*?/\
+                title = supplier_name.translate(_SHEET_TITLE_TABLE)[:31]
+                self._write_sheet(workbook.create_sheet(title), products)
+                total += len(products)
+            
+            filepath = self._build_filepath('all_suppliers', 'xlsx')
+            workbook.save(filepath)
+            
+            self.logger.info(
+                f"Exported {total} products from {len(supplier_products)} suppliers to {filepath}"
+            )
+            return filepath
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export to Excel: {e}", exc_info=True)
+            return ""
+    
     def export_to_json(self, products: List[Dict[str, Any]], 
                       supplier_name: str) -> str:
         """
@@ -112,15 +218,10 @@ class DataExporter:
             return ""
         
         try:
-            import json
+            filepath = self._build_filepath(supplier_name, 'json')
             
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            safe_supplier_name = supplier_name.lower().replace(' ', '_')
-            filename = f"{safe_supplier_name}_export_{timestamp}.json"
-            filepath = os.path.join(self.output_dir, filename)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(products, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(json_dump_bytes(products))
             
             self.logger.info(f"Exported {len(products)} products to {filepath}")
             return filepath
@@ -128,3 +229,82 @@ class DataExporter:
         except Exception as e:
             self.logger.error(f"Failed to export to JSON: {e}", exc_info=True)
             return ""
+    
+    def export_to_csv(self, products: List[Dict[str, Any]], 
+                      supplier_name: str) -> str:
+        """
+        Export products to CSV file.
+        
+        Uses the same columns and Spanish headers as the Excel export,
+        without the cost of building an xlsx workbook.
+        
+        Args:
+            products: List of product dictionaries
+            supplier_name: Name of supplier (for filename)
+            
+        Returns:
+            Path to the created CSV file
+        """
+        if not products:
+            self.logger.warning("No products to export")
+            return ""
+        
+        try:
+            filepath = self._build_filepath(supplier_name, 'csv')
+            
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=COLUMN_ORDER, extrasaction='ignore')
+                writer.writerow(COLUMN_MAPPING)
+                writer.writerows(products)
+            
+            self.logger.info(f"Exported {len(products)} products to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export to CSV: {e}", exc_info=True)
+            return ""
+    
+    def export_to_parquet(self, products: List[Dict[str, Any]], 
+                          supplier_name: str) -> str:
+        """
+        Export products to a zstd-compressed Parquet file.
+        
+        Uses the same columns and Spanish headers as the Excel export.
+        Requires the optional pyarrow package.
+        
+        Args:
+            products: List of product dictionaries
+            supplier_name: Name of supplier (for filename)
+            
+        Returns:
+            Path to the created Parquet file
+        """
+        if not products:
+            self.logger.warning("No products to export")
+            return ""
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            filepath = self._build_filepath(supplier_name, 'parquet')
+            
+            rows = []
+            for product in products:
+                row = {}
+                for col in COLUMN_ORDER:
+                    value = product.get(col)
+                    if value is not None and col not in _PARQUET_NUMERIC_COLUMNS:
+                        value = str(value)
+                    row[col] = value
+                rows.append(row)
+            
+            table = pa.Table.from_pylist(rows).rename_columns([COLUMN_MAPPING[col] for col in COLUMN_ORDER])
+            pq.write_table(table, filepath, compression='zstd')
+            
+            self.logger.info(f"Exported {len(products)} products to {filepath}")
+            return filepath
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export to Parquet: {e}", exc_info=True)
+            return ""
@@ -1,7 +1,138 @@
 """Data parsing utilities for product information extraction."""
 
 import re
-from typing import Tuple, Dict, Any
+from functools import lru_cache
+from typing import Tuple, Dict, Any, Optional, Callable
+
+
+# Quantity + unit, with optional "x" prefix:
+# - "500 gr", "500gr", "500 g", "500g"
+# - "x 500 gr", "x 500g"
+# - "1 litro", "1l", "1 L"
+# - "500cc", "500 cc", "500ml", "500 ml"
+_UNIT_PATTERN = r'(?:x\s+)?(\d+(?:[.,]\d+)?)\s*(gr|g|gramos?|kilos?|kilo|kg|litros?|l|cc|ml|mililitros?|un\.|u\.|u|lb)\.?'
+
+_UNIT_RE = re.compile(_UNIT_PATTERN, re.IGNORECASE)
+_UNIT_DASH_RE = re.compile(_UNIT_PATTERN + r'\s*[–-]', re.IGNORECASE)
+
+# Units _UNIT_PATTERN accepts at the end of a title ("un" only as "un.")
+_TAIL_UNITS = frozenset([
+    'gr', 'g', 'gramo', 'gramos', 'kilo', 'kilos', 'kg', 'litro', 'litros', 'l',
+    'cc', 'ml', 'mililitro', 'mililitros', 'u', 'lb'
+])
+
+# Currency symbols stripped from prices ("$", "US$", "AR$")
+_CURRENCY_PATTERN = r'(?:US|AR)?\$'
+
+# Raw unit (lowercased, dots removed) -> standardized unit
+_UNIT_MAP = {
+    'gr': 'G', 'g': 'G', 'gramo': 'G', 'gramos': 'G', 'un': 'G', 'u': 'G', 'lb': 'G',
+    'kilos': 'KG', 'kilo': 'KG', 'kg': 'KG',
+    'litros': 'L', 'litro': 'L', 'l': 'L',
+    'cc': 'ML', 'ml': 'ML', 'mililitro': 'ML', 'mililitros': 'ML',
+}
+
+# Separator dashes only (whitespace on at least one side), not hyphens in compound words
+_SEPARATOR_DASH_RE = re.compile(r'\s+[–-]\s*|\s*[–-]\s+')
+_WS_RE = re.compile(r'\s+')
+_POR_KILO_RE = re.compile(r'\s*por\s*kilo$', re.IGNORECASE)
+
+
+def _scan_unit_tail(name: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Replicate the end-anchored ``_UNIT_PATTERN + '$'`` match with a right-to-left scan.
+    
+    Handles the common "<name> [x ]<number> <unit>" shape without running
+    the backtracking regex; returns the same pieces the regex would capture.
+    
+    Args:
+        name: Stripped product title
+        
+    Returns:
+        Tuple of (quantity text, unit letters, matched text), or None if the
+        title does not end in a quantity and unit
+    """
+    end = len(name)
+    
+    # Up to two trailing dots: "un." + optional ".", or unit + optional "."
+    dots = 0
+    while dots < 2 and end and name[end - 1] == '.':
+        end -= 1
+        dots += 1
+    
+    unit_end = end
+    while end and name[end - 1].isalpha():
+        end -= 1
+    raw_unit = name[end:unit_end].lower()
+    
+    if dots == 2:
+        valid = raw_unit in ('un', 'u')
+    else:
+        valid = raw_unit in _TAIL_UNITS or (dots == 1 and raw_unit == 'un')
+    if not valid:
+        return None
+    
+    while end and name[end - 1].isspace():
+        end -= 1
+    
+    number_end = end
+    while end and name[end - 1].isdecimal():
+        end -= 1
+    if end == number_end:
+        return None
+    
+    # Optional decimal part: "1,5" / "2.25"
+    if end >= 2 and name[end - 1] in '.,' and name[end - 2].isdecimal():
+        end -= 1
+        while end and name[end - 1].isdecimal():
+            end -= 1
+    raw_quantity = name[end:number_end]
+    
+    # Optional "x " prefix
+    start = end
+    while start and name[start - 1].isspace():
+        start -= 1
+    if start < end and start and name[start - 1] in 'xX':
+        end = start - 1
+    
+    return raw_quantity, raw_unit, name[end:]
+
+
+@lru_cache(maxsize=8192)
+def _clean_price(price_text: str, thousands_sep: str, decimal_sep: str) -> Tuple[float, str]:
+    """
+    Memoized body of DataParser.clean_price, keyed on the resolved separators.
+    
+    Args:
+        price_text: Raw price text
+        thousands_sep: Thousands separator to strip (may be empty)
+        decimal_sep: Decimal separator to normalize to '.' (may be empty)
+        
+    Returns:
+        Tuple of (numeric_price as float, formatted_price as string)
+    """
+    cleaned = str(price_text)
+    
+    # Remove currency symbols (prefixed ones first) and extra spaces
+    if '$' in cleaned:
+        cleaned = cleaned.replace('US$', '').replace('AR$', '').replace('$', '')
+    cleaned = cleaned.strip()
+    
+    # Remove thousands separator
+    if thousands_sep:
+        cleaned = cleaned.replace(thousands_sep, '')
+    
+    # Replace decimal separator with standard '.'
+    if decimal_sep and decimal_sep != '.':
+        cleaned = cleaned.replace(decimal_sep, '.')
+    
+    try:
+        numeric_price = float(cleaned)
+        # Format with 2 decimal places
+        formatted_price = f"{numeric_price:.2f}"
+        return numeric_price, formatted_price
+    except ValueError:
+        return 0.0, price_text.strip()
 
 
 class DataParser:
@@ -12,6 +143,7 @@ class DataParser:
     and prices from product text.
     """
     @staticmethod
+    @lru_cache(maxsize=8192)
     def parse_product_title(full_title: str, default_unit: str = 'UNIT') -> Tuple[str, str, str]:
         """
         Parse product title into name, quantity, and unit.
@@ -32,6 +164,9 @@ class DataParser:
         - cc, ml, mililitros → ML
         - default → UNIT (quantity = 1)
         
+        Results are memoized since catalogs repeat titles across categories;
+        see ``DataParser.parse_product_title.cache_info()`` for hit rates.
+        
         Args:
             full_title: Full product title string
             
@@ -41,53 +176,41 @@ class DataParser:
         name = full_title.strip()
         
         # Remove leading 3-digit codes (e.g., "001 Producto")
-        name = re.sub(r'^\s*\d{3}\s+', '', name).strip()
+        if len(name) > 3 and name[:3].isdecimal() and name[3].isspace():
+            name = name[4:].strip()
         
         # Try to match quantity and unit patterns
         # First attempt: at the end of string (most common)
         # Second attempt: followed by dash/hyphen (e.g., "x 5 kg – description")
         
-        # Pattern with various formats:
-        # - "500 gr", "500gr", "500 g", "500g"
-        # - "x 500 gr", "x 500g" (with optional "x" prefix)
-        # - "1 litro", "1l", "1 L"
-        # - "500cc", "500 cc", "500ml", "500 ml"
-        unit_pattern = r'(?:x\s+)?(\d+(?:[.,]\d+)?)\s*(gr|g|gramos?|kilos?|kilo|kg|litros?|l|cc|ml|mililitros?|un\.|u\.|u|lb)\.?'
-        
-        # Try at end of string first
-        match = re.search(unit_pattern + r'$', name, re.IGNORECASE)
-        
-        # If not found at end, try before dash/hyphen (common in De Marchi format)
-        if not match:
-            match = re.search(unit_pattern + r'\s*[–-]', name, re.IGNORECASE)
+        # Try at end of string first, scanning instead of matching _UNIT_PATTERN + '$'
+        parts = _scan_unit_tail(name)
         
-        # If still not found, try anywhere in the string (but prefer first occurrence)
-        if not match:
-            match = re.search(unit_pattern, name, re.IGNORECASE)
+        if not parts:
+            # If not found at end, try before dash/hyphen (common in De Marchi format)
+            match = _UNIT_DASH_RE.search(name)
+            
+            # If still not found, try anywhere in the string (but prefer first occurrence)
+            if not match:
+                match = _UNIT_RE.search(name)
+            
+            if match:
+                parts = match.group(1), match.group(2), match.group(0)
         
         quantity = "1"
         unit = default_unit
         matched_text = ""
         
-        if match:
-            raw_quantity = match.group(1).strip().replace(',', '.')
-            raw_unit = match.group(2).strip().lower().replace('.', '')
+        if parts:
+            raw_quantity = parts[0].strip().replace(',', '.')
+            raw_unit = parts[1].strip().lower().replace('.', '')
             
             # Get the full matched text, but strip any trailing dash that might be included
             # (when matching before a dash, the pattern includes the dash)
-            matched_text = match.group(0).rstrip('–-').strip()
+            matched_text = parts[2].rstrip('–-').strip()
             
             # Standardize unit
-            if raw_unit in ['gr', 'g', 'gramo', 'gramos', 'un', 'u', 'lb']:
-                unit = "G"
-            elif raw_unit in ['kilos', 'kilo', 'kg']:
-                unit = "KG"
-            elif raw_unit in ['litros', 'litro', 'l']:
-                unit = "L"
-            elif raw_unit in ['cc', 'ml', 'mililitro', 'mililitros']:
-                unit = "ML"
-            else:
-                unit = "UNIT"
+            unit = _UNIT_MAP.get(raw_unit, "UNIT")
             
             # Convert quantity to integer if it's a whole number
             try:
@@ -101,23 +224,25 @@ class DataParser:
             
             # Remove the matched unit pattern from name
             # Check if the matched text is followed by a dash (De Marchi format: "x N unit – description")
-            pattern_with_dash = re.escape(matched_text) + r'\s*[–-]'
-            if re.search(pattern_with_dash, name):
-                # Replace "x N unit" before dash, keeping the dash
-                name = re.sub(pattern_with_dash, ' –', name)
-            else:
+            # Replace "x N unit" before dash, keeping the dash
+            name, replaced = re.subn(re.escape(matched_text) + r'\s*[–-]', ' –', name)
+            if not replaced:
                 # Standard removal for end-of-string matches or other positions
                 name = name.replace(matched_text, '')
             
             # Normalize only separator dashes (those with spaces), not hyphens in compound words
-            # Only normalize dashes that have at least one space on either side
-            name = re.sub(r'\s+[–-]\s*', ' – ', name)  # Space before dash
-            name = re.sub(r'\s*[–-]\s+', ' – ', name)  # Space after dash
-            name = re.sub(r'\s+', ' ', name)  # Normalize multiple spaces
+            if '-' in name or '–' in name:
+                name = _SEPARATOR_DASH_RE.sub(' – ', name)
+            name = _WS_RE.sub(' ', name)  # Normalize multiple spaces
             name = name.strip()
         
         # Remove "por kilo" suffix
-        name = re.sub(r'\s*por\s*kilo$', '', name, flags=re.IGNORECASE).strip()
+        if name[-4:].lower() == 'kilo':
+            if name[-8:].lower() == 'por kilo':
+                name = name[:-8].strip()
+            else:
+                # Irregular spacing ("porkilo", "por  kilo")
+                name = _POR_KILO_RE.sub('', name).strip()
         
         return name, quantity, unit
     
@@ -147,8 +272,66 @@ class DataParser:
             # Piala format (thousands='.', decimal=',')
             clean_price("1.400,00", {"thousands_separator": ".", "decimal_separator": ","}) -> (1400.0, "1400.00")
         """
+        # Get format configuration or use defaults
+        if price_format is None:
+            price_format = {}
+        
+        thousands_sep = price_format.get('thousands_separator', '.')
+        decimal_sep = price_format.get('decimal_separator', ',')
+        
+        # Cached on (text, separators); see _clean_price.cache_info()
+        return _clean_price(price_text, thousands_sep, decimal_sep)
+    
+    @staticmethod
+    def make_price_cleaner(price_format: Dict[str, str] = None) -> Callable[[str], Tuple[float, str]]:
+        """
+        Build a clean_price specialized for one price format.
+        
+        The separators are resolved from the format dict once, so per-row
+        calls go straight to the memoized cleaner.
+        
+        Args:
+            price_format: Optional dict with 'thousands_separator' and 'decimal_separator' keys
+                         If None, uses default format (thousands='.', decimal=',')
+            
+        Returns:
+            Function mapping price text to (numeric_price, formatted_price)
+        """
+        if price_format is None:
+            price_format = {}
+        
+        thousands_sep = price_format.get('thousands_separator', '.')
+        decimal_sep = price_format.get('decimal_separator', ',')
+        
+        def clean(price_text: str) -> Tuple[float, str]:
+            return _clean_price(price_text, thousands_sep, decimal_sep)
+        
+        return clean
+    
+    @staticmethod
+    def clean_prices_series(prices, price_format: Dict[str, str] = None):
+        """
+        Vectorized clean_price over a whole pandas Series.
+        
+        Applies the same currency-symbol and separator handling as
+        clean_price with column-wide string operations instead of one
+        Python call per cell.
+        
+        Args:
+            prices: pandas Series of raw price values
+            price_format: Optional dict with 'thousands_separator' and 'decimal_separator' keys
+                         If None, uses default format (thousands='.', decimal=',')
+            
+        Returns:
+            Tuple of (numeric prices as float Series, formatted prices as string Series).
+            Unparsable entries get 0.0 and their stripped original text, as in clean_price.
+        """
+        import pandas as pd
+        
+        text = prices.astype(str)
+        
         # Remove currency symbols and extra spaces
-        cleaned = str(price_text).replace('$', '').replace('US$', '').replace('AR$', '').strip()
+        cleaned = text.str.replace(_CURRENCY_PATTERN, '', regex=True).str.strip()
         
         # Get format configuration or use defaults
         if price_format is None:
@@ -157,21 +340,17 @@ class DataParser:
         thousands_sep = price_format.get('thousands_separator', '.')
         decimal_sep = price_format.get('decimal_separator', ',')
         
-        # Remove thousands separator
         if thousands_sep:
-            cleaned = cleaned.replace(thousands_sep, '')
+            cleaned = cleaned.str.replace(thousands_sep, '', regex=False)
         
-        # Replace decimal separator with standard '.'
         if decimal_sep and decimal_sep != '.':
-            cleaned = cleaned.replace(decimal_sep, '.')
-        
-        try:
-            numeric_price = float(cleaned)
-            # Format with 2 decimal places
-            formatted_price = f"{numeric_price:.2f}"
-            return numeric_price, formatted_price
-        except ValueError:
-            return 0.0, price_text.strip()
+            cleaned = cleaned.str.replace(decimal_sep, '.', regex=False)
+        
+        numeric = pd.to_numeric(cleaned, errors='coerce').astype(float)
+        parsed = numeric.notna()
+        
+        formatted = numeric.map('{:.2f}'.format).where(parsed, text.str.strip())
+        return numeric.fillna(0.0), formatted
     
     @staticmethod
     def standardize_product_data(raw_product: Dict[str, Any], supplier_id: int, 
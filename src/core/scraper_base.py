@@ -1,7 +1,9 @@
 """Base scraper class defining the common interface for all scrapers."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 
@@ -12,8 +14,14 @@ class ScraperBase(ABC):
     Defines the common interface and workflow that all scrapers must implement.
     Each supplier scraper should inherit from this class and implement the
     abstract methods according to their specific website structure.
+    
+    Scrapers whose strategy supports concurrent fetching can set
+    ``prefetch_urls = True`` to fetch every URL up front with
+    ``strategy.fetch_many`` before extracting products in URL order.
     """
     
+    prefetch_urls = False
+    
     def __init__(self, config: Dict[str, Any], api_client: 'APIClient'):
         """
         Initialize the scraper with configuration and API client.
@@ -46,12 +54,13 @@ class ScraperBase(ABC):
         pass
     
     @abstractmethod
-    def extract_products(self, html_content: str, url: str) -> List[Dict[str, Any]]:
+    def extract_products(self, html_content: Any, url: str) -> List[Dict[str, Any]]:
         """
         Extract product data from HTML content.
         
         Args:
-            html_content: Raw HTML content from the page
+            html_content: Raw HTML content from the page (file-based scrapers
+                receive the extracted rows returned by their _fetch_html)
             url: The URL that was scraped (for context/images)
             
         Returns:
@@ -63,41 +72,58 @@ class ScraperBase(ABC):
         """
         Main scraping workflow orchestrator.
         
+        Extraction, deduplication and API integration are chained as
+        generators, so each product flows through all stages without
+        intermediate full-size lists.
+        
         Returns:
             List of successfully processed products ready for export
         """
         self.logger.info(f"Starting scrape for {self.config['supplier_name']}")
         
-        all_products = []
+        # Process and deduplicate, then fetch product IDs and post to API
+        processed_products = self._process_products(self._extract_all())
+        
+        return self._integrate_with_api(processed_products)
+    
+    def _extract_all(self) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape every URL and yield extracted products as they are found.
+        
+        Yields:
+            Raw product dictionaries, in URL order
+        """
         urls = self.get_urls()
+        pages = self.strategy.fetch_many(urls) if self.prefetch_urls else None
+        total = 0
         
         for url in urls:
             self.logger.info(f"Scraping URL: {url}")
             try:
-                # Get HTML using the appropriate strategy
-                html_content = self._fetch_html(url)
+                if pages is None:
+                    # Get HTML using the appropriate strategy
+                    html_content = self._fetch_html(url)
+                elif url in pages:
+                    html_content = pages[url]
+                else:
+                    # fetch_many already logged why this URL failed
+                    self.logger.error(f"Failed to scrape {url}")
+                    continue
                 
                 # Extract products from HTML
                 products = self.extract_products(html_content, url)
-                all_products.extend(products)
-                
-                self.logger.info(f"Extracted {len(products)} products from {url}")
             except Exception as e:
                 self.logger.error(f"Failed to scrape {url}: {e}", exc_info=True)
                 continue
+            
+            self.logger.info(f"Extracted {len(products)} products from {url}")
+            total += len(products)
+            yield from products
         
-        self.logger.info(f"Total products extracted: {len(all_products)}")
-        
-        # Process and deduplicate        
-        processed_products = self._process_products(all_products)
-        
-        # Fetch product IDs and post to API
-        final_products = self._integrate_with_api(processed_products)
-
-        return final_products
+        self.logger.info(f"Total products extracted: {total}")
 
     @abstractmethod
-    def _fetch_html(self, url: str) -> str:
+    def _fetch_html(self, url: str) -> Any:
         """
         Fetch HTML content using the appropriate scraping strategy.
         
@@ -105,64 +131,131 @@ class ScraperBase(ABC):
             url: URL to fetch
             
         Returns:
-            HTML content as string
+            HTML content as string (file-based scrapers return extracted rows,
+            passed straight to extract_products)
         """
         pass
     
-    def _process_products(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_products(self, products: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
         """
         Process and deduplicate products.
         
         Args:
-            products: Raw product list
+            products: Raw products, consumed lazily
             
-        Returns:
-            Deduplicated and standardized product list
+        Yields:
+            Deduplicated and standardized products
         """
-        from ..utils.text_processing import deduplicate_products
+        from ..utils.text_processing import dedup_stream
+        
+        self.logger.info("Processing products...")
+        total = 0
+        kept = 0
         
-        self.logger.info(f"Processing {len(products)} products...")
-        deduplicated = deduplicate_products(products)
-        removed = len(products) - len(deduplicated)
+        def counted(items):
+            nonlocal total
+            for item in items:
+                total += 1
+                yield item
         
+        for product in dedup_stream(counted(products)):
+            kept += 1
+            yield product
+        
+        removed = total - kept
         if removed > 0:
             self.logger.info(f"Removed {removed} duplicate products")
-        
-        return deduplicated
     
-    def _integrate_with_api(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _integrate_with_api(self, products: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Fetch product IDs and post to API.
         
+        Product ID lookups run concurrently on a thread pool of
+        ``api_workers`` threads (config, default 16), with at most twice that
+        many in flight. Products with an ID are buffered and posted in
+        batches of ``api_batch_size`` (default 100) through
+        APIClient.post_items_bulk, which posts item by item unless the API
+        config enables the bulk endpoint. Results keep the input order.
+        
         Args:
-            products: Processed product list
+            products: Processed products, consumed lazily
             
         Returns:
             Products successfully posted to API
         """
-        self.logger.info(f"Integrating {len(products)} products with API...")
+        self.logger.info("Integrating products with API...")
         
+        max_workers = self.config.get('api_workers', 16)
+        batch_size = self.config.get('api_batch_size', 100)
         successful_products = []
+        ready = []
+        pending = deque()
         
-        for product in products:
-            product_name = product.get('name')
-            
-            # Fetch product ID from API
-            product_id = self.api_client.fetch_product_id(product_name)
-            
-            if product_id is None:
-                self.logger.warning(f"Skipping {product_name}: No product ID found")
-                continue
-            
-            product['productId'] = product_id
+        def flush() -> None:
+            results = self.api_client.post_items_bulk(ready, chunk_size=batch_size)
+            successful_products.extend(product for product, ok in zip(ready, results) if ok)
+            ready.clear()
+        
+        def collect(future) -> None:
+            product = future.result()
+            if product is not None:
+                ready.append(product)
+                if len(ready) >= batch_size:
+                    flush()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for product in products:
+                pending.append(executor.submit(self._resolve_product_id, product))
+                
+                # Bound the backlog so the stream is not drained ahead of the API
+                if len(pending) >= max_workers * 2:
+                    collect(pending.popleft())
             
-            # Post to API
-            if self.api_client.post_item(product):
-                successful_products.append(product)
+            while pending:
+                collect(pending.popleft())
+        
+        if ready:
+            flush()
         
         self.logger.info(f"Successfully posted {len(successful_products)} products to API")
         return successful_products
     
+    def _resolve_product_id(self, product: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up the backend product ID for one product.
+        
+        Args:
+            product: Processed product dictionary (productId is set in place)
+            
+        Returns:
+            The product if an ID was found, None otherwise
+        """
+        product_name = product.get('name')
+        
+        # Fetch product ID from API
+        product_id = self.api_client.fetch_product_id(product_name)
+        
+        if product_id is None:
+            self.logger.warning(f"Skipping {product_name}: No product ID found")
+            return None
+        
+        product['productId'] = product_id
+        return product
+    
+    def close(self) -> None:
+        """Release the scraping strategy's resources (sessions, browsers, files)."""
+        strategy = getattr(self, 'strategy', None)
+        if strategy is not None:
+            strategy.close()
+    
+    def __enter__(self) -> 'ScraperBase':
+        """Use the scraper as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the scraper when leaving the ``with`` block."""
+        self.close()
+    
     def get_supplier_id(self) -> int:
         """Get the supplier ID from configuration."""
         return self.config['supplier_id']
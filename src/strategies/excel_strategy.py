@@ -1,11 +1,11 @@
-"""Excel file parsing strategy using openpyxl and pandas."""
+"""Excel file parsing strategy using openpyxl (or python-calamine) and pandas."""
 
-import openpyxl
-import pandas as pd
 import logging
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, List, Tuple
 
 from .file_strategy import FileStrategy
+from ..core.parser import DataParser
 
 
 class ExcelStrategy(FileStrategy):
@@ -26,12 +26,20 @@ class ExcelStrategy(FileStrategy):
                 - header_row: Row index for headers (default: 0)
                 - skip_rows: Number of rows to skip at start
                 - use_pandas: Use pandas for reading (default: True)
+                - price_columns: Columns cleaned with DataParser.clean_prices_series
+                  on the pandas path (values become "1234.56" strings)
+                - price_format: Price format passed to clean_prices_series
         """
         super().__init__(config)
         self.sheet_name = config.get('sheet_name', 0)
         self.header_row = config.get('header_row', 0)
         self.skip_rows = config.get('skip_rows', None)
         self.use_pandas = config.get('use_pandas', True)
+        self.price_columns = config.get('price_columns', [])
+        self.price_format = config.get('price_format')
+        
+        # Extracted rows keyed by path, invalidated on (mtime_ns, size) change
+        self._cache: Dict[str, Tuple[int, int, List[Dict[str, Any]]]] = {}
         
         self.logger.info("Excel strategy initialized")
     
@@ -39,6 +47,9 @@ class ExcelStrategy(FileStrategy):
         """
         Extract structured data from Excel file.
         
+        Repeated calls for an unchanged file reuse the rows parsed the first
+        time; each call returns fresh row dicts that callers may mutate.
+        
         Args:
             file_path: Path to Excel file
             
@@ -51,13 +62,22 @@ class ExcelStrategy(FileStrategy):
         self.logger.info(f"Extracting data from Excel: {file_path}")
         
         try:
-            if self.use_pandas:
-                data = self._extract_with_pandas(file_path)
+            stat = os.stat(file_path)
+            cached = self._cache.get(file_path)
+            
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                data = cached[2]
+                self.logger.info(f"Reusing {len(data)} rows already extracted from {file_path}")
             else:
-                data = self._extract_with_openpyxl(file_path)
+                if self.use_pandas:
+                    data = self._extract_with_pandas(file_path)
+                else:
+                    data = self._extract_with_openpyxl(file_path)
+                
+                self._cache[file_path] = (stat.st_mtime_ns, stat.st_size, data)
+                self.logger.info(f"Extracted {len(data)} rows from Excel")
             
-            self.logger.info(f"Extracted {len(data)} rows from Excel")
-            return data
+            return [dict(row) for row in data]
             
         except Exception as e:
             self.logger.error(f"Failed to extract data from Excel: {e}", exc_info=True)
@@ -73,13 +93,25 @@ class ExcelStrategy(FileStrategy):
         Returns:
             List of row dictionaries
         """
-        # Read Excel file
-        df = pd.read_excel(
-            file_path,
-            sheet_name=self.sheet_name,
-            header=self.header_row,
-            skiprows=self.skip_rows
-        )
+        import pandas as pd
+        
+        # Read every cell as text with NA detection off: empty cells come back
+        # as '' directly, so no dtype inference or fillna pass is needed
+        read_options = {
+            'sheet_name': self.sheet_name,
+            'header': self.header_row,
+            'skiprows': self.skip_rows,
+            'dtype': str,
+            'keep_default_na': False,
+            'na_filter': False,
+        }
+        
+        # Prefer the Rust calamine engine (pandas >= 2.2 with python-calamine)
+        try:
+            df = pd.read_excel(file_path, engine='calamine', **read_options)
+        except (ImportError, ValueError) as e:
+            self.logger.debug(f"calamine engine unavailable ({e}), using default engine")
+            df = pd.read_excel(file_path, **read_options)
         
         # Clean column names only if they're strings
         if all(isinstance(col, str) for col in df.columns):
@@ -88,21 +120,70 @@ class ExcelStrategy(FileStrategy):
             # If columns are not strings (e.g., integers), keep them as-is
             pass
         
-        # Replace NaN with empty strings
-        df = df.fillna('')
+        # Clean whole price columns at once instead of per row downstream
+        for col in self.price_columns:
+            if col in df.columns:
+                _, df[col] = DataParser.clean_prices_series(df[col], self.price_format)
+        
+        # Add row numbers as a column so to_dict sets them in the same pass
+        df['_row'] = range(1, len(df) + 1)
         
         # Convert to list of dictionaries
-        data = df.to_dict('records')
+        return df.to_dict('records')
+    
+    def _iter_sheet_rows(self, file_path: str):
+        """
+        Yield the configured sheet's rows as sequences of cell values, top row first.
         
-        # Add row numbers
-        for idx, row in enumerate(data, 1):
-            row['_row'] = idx
+        Uses python-calamine (Rust reader) when it is installed and falls back
+        to openpyxl otherwise. Empty cells may be None or ''.
         
-        return data
+        Args:
+            file_path: Path to Excel file
+            
+        Yields:
+            Row value sequences, starting at the sheet's first row
+        """
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:
+            CalamineWorkbook = None
+        
+        if CalamineWorkbook is not None:
+            workbook = CalamineWorkbook.from_path(file_path)
+            
+            if isinstance(self.sheet_name, int):
+                sheet = workbook.get_sheet_by_index(self.sheet_name)
+            else:
+                sheet = workbook.get_sheet_by_name(self.sheet_name)
+            
+            # Keep leading empty rows so row indices match openpyxl's;
+            # calamine reports whole numbers as floats, openpyxl as ints
+            for row in sheet.to_python(skip_empty_area=False):
+                yield [int(v) if isinstance(v, float) and v.is_integer() else v for v in row]
+            return
+        
+        import openpyxl
+        
+        # read_only streams rows from the XML instead of building every cell object
+        workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
+        
+        try:
+            # Get sheet
+            if isinstance(self.sheet_name, int):
+                sheet = workbook.worksheets[self.sheet_name]
+            else:
+                sheet = workbook[self.sheet_name]
+            
+            yield from sheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
     
     def _extract_with_openpyxl(self, file_path: str) -> List[Dict[str, Any]]:
         """
-        Extract data using openpyxl (lower-level, more control).
+        Extract data row by row (lower-level, more control).
+        
+        Reads through python-calamine when available, otherwise openpyxl.
         
         Args:
             file_path: Path to Excel file
@@ -110,44 +191,43 @@ class ExcelStrategy(FileStrategy):
         Returns:
             List of row dictionaries
         """
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
-        
-        # Get sheet
-        if isinstance(self.sheet_name, int):
-            sheet = workbook.worksheets[self.sheet_name]
-        else:
-            sheet = workbook[self.sheet_name]
-        
         data = []
-        
-        # Get header row
-        header_row_idx = self.header_row + 1  # openpyxl is 1-indexed
-        headers = []
-        
-        for cell in sheet[header_row_idx]:
-            header = str(cell.value).strip().lower().replace(' ', '_') if cell.value else ''
-            headers.append(header)
+        active_columns = []
         
         # Process data rows
-        start_row = header_row_idx + 1
+        start_row = self.header_row + 1
         if self.skip_rows:
             start_row += self.skip_rows
         
-        for row_idx, row in enumerate(sheet.iter_rows(min_row=start_row, values_only=True), 1):
+        row_idx = 0
+        for sheet_row_idx, row in enumerate(self._iter_sheet_rows(file_path)):
+            # Get header row
+            if sheet_row_idx == self.header_row:
+                headers = [str(value).strip().lower().replace(' ', '_') if value else '' for value in row]
+                
+                # Only columns with a header are kept; resolve them once
+                active_columns = [(idx, header) for idx, header in enumerate(headers) if header]
+                continue
+            
+            if sheet_row_idx < start_row:
+                continue
+            
+            row_idx += 1
             if not row or all(cell is None or str(cell).strip() == '' for cell in row):
                 continue
             
-            row_dict = {}
-            for header, value in zip(headers, row):
-                if header:
-                    row_dict[header] = str(value).strip() if value else ''
+            row_len = len(row)
+            row_dict = {
+                header: str(row[idx]).strip() if row[idx] else ''
+                for idx, header in active_columns if idx < row_len
+            }
             
             row_dict['_row'] = row_idx
             data.append(row_dict)
         
-        workbook.close()
         return data
     
     def close(self) -> None:
         """Clean up resources."""
+        self._cache.clear()
         self.logger.info("Excel strategy closed")
@@ -1,11 +1,21 @@
 """PDF parsing strategy using pdfplumber."""
 
 import pdfplumber
+import hashlib
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, List
 import re
 
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTTextContainer
+
 from .file_strategy import FileStrategy
+from ..utils.json_utils import json_encode, json_loads
+
+# Text-mode layout: keep boxes in reading position order, no vertical text detection
+_TEXT_LAPARAMS = LAParams(boxes_flow=None, detect_vertical=False)
 
 
 class PDFStrategy(FileStrategy):
@@ -23,12 +33,22 @@ class PDFStrategy(FileStrategy):
             config: Configuration dictionary with optional keys:
                 - table_settings: pdfplumber table extraction settings
                 - page_range: Tuple of (start_page, end_page) to parse
-                - text_mode: If True, extract text instead of tables
+                - text_mode: If True, extract text instead of tables (read with
+                  pdfminer directly, skipping pdfplumber's char/rect/line detection)
+                - num_workers: Worker processes for page extraction
+                  (default: min(cpu_count, 4); 1 disables the pool)
+                - pages_per_task: Pages each worker task opens and extracts (default: 4)
+                - cache_enabled: Reuse rows extracted by a previous run from disk (default: False)
+                - cache_dir: Directory for cached rows (default: '.cache/pdf')
         """
         super().__init__(config)
         self.table_settings = config.get('table_settings', {})
         self.page_range = config.get('page_range', None)
         self.text_mode = config.get('text_mode', False)
+        self.num_workers = config.get('num_workers', min(os.cpu_count() or 1, 4))
+        self.pages_per_task = config.get('pages_per_task', 4)
+        self.cache_enabled = config.get('cache_enabled', False)
+        self.cache_dir = config.get('cache_dir', os.path.join('.cache', 'pdf'))
         
         self.logger.info("PDF strategy initialized")
     
@@ -36,6 +56,10 @@ class PDFStrategy(FileStrategy):
         """
         Extract structured data from PDF file.
         
+        Pages are split into tasks of ``pages_per_task`` pages and extracted
+        on a process pool (pdfplumber is CPU-bound); rows are merged back in
+        page order.
+        
         Args:
             file_path: Path to PDF file
             
@@ -47,39 +71,122 @@ class PDFStrategy(FileStrategy):
         """
         self.logger.info(f"Extracting data from PDF: {file_path}")
         
+        cache_path = self._cache_path(file_path) if self.cache_enabled else None
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                all_data = json_loads(f.read())
+            self.logger.info(f"Loaded {len(all_data)} cached rows from {cache_path}")
+            return all_data
+        
         all_data = []
         
         try:
             with pdfplumber.open(file_path) as pdf:
-                pages = pdf.pages
-                
-                # Apply page range filter if specified
-                if self.page_range:
-                    start, end = self.page_range
-                    pages = pages[start-1:end]
-                
-                self.logger.info(f"Processing {len(pages)} pages from PDF")
-                
-                for page_num, page in enumerate(pages, 1):
-                    self.logger.debug(f"Processing page {page_num}")
-                    
-                    if self.text_mode:
-                        # Extract text mode
-                        page_data = self._extract_text_data(page, page_num)
-                    else:
-                        # Extract tables mode
-                        page_data = self._extract_table_data(page, page_num)
-                    
-                    all_data.extend(page_data)
-                
-                self.logger.info(f"Extracted {len(all_data)} rows from PDF")
+                page_numbers = list(range(1, len(pdf.pages) + 1))
+            
+            # Apply page range filter if specified
+            if self.page_range:
+                start, end = self.page_range
+                page_numbers = page_numbers[start-1:end]
+            
+            self.logger.info(f"Processing {len(page_numbers)} pages from PDF")
+            
+            # (pdf page numbers, number of the first one within the processed range)
+            tasks = [
+                (page_numbers[i:i + self.pages_per_task], i + 1)
+                for i in range(0, len(page_numbers), self.pages_per_task)
+            ]
+            
+            if self.num_workers > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=min(self.num_workers, len(tasks))) as executor:
+                    results = executor.map(
+                        self._extract_pages,
+                        [file_path] * len(tasks),
+                        [task[0] for task in tasks],
+                        [task[1] for task in tasks]
+                    )
+                    for page_data in results:
+                        all_data.extend(page_data)
+            else:
+                all_data = self._extract_pages(file_path, page_numbers, 1)
+            
+            self.logger.info(f"Extracted {len(all_data)} rows from PDF")
                 
         except Exception as e:
             self.logger.error(f"Failed to extract data from PDF: {e}", exc_info=True)
             raise
         
+        if cache_path:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(json_encode(all_data))
+        
         return all_data
     
+    def _cache_path(self, file_path: str) -> str:
+        """
+        Build the on-disk cache path for a PDF's extracted rows.
+        
+        The key covers the file identity (path, mtime, size) and every
+        setting that changes the extracted rows, so edits invalidate it.
+        
+        Args:
+            file_path: Path to PDF file
+            
+        Returns:
+            Path of the cached JSON rows file
+        """
+        stat = os.stat(file_path)
+        key = json_encode([
+            os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+            self.text_mode, self.page_range, self.table_settings
+        ])
+        return os.path.join(self.cache_dir, f"{hashlib.sha1(key).hexdigest()}.json")
+    
+    def _extract_pages(self, file_path: str, page_numbers: List[int], first_page_num: int) -> List[Dict[str, Any]]:
+        """
+        Open a PDF restricted to some pages and extract their rows.
+        
+        Runs in worker processes, so it only relies on picklable state.
+        
+        Args:
+            file_path: Path to PDF file
+            page_numbers: 1-based PDF page numbers to extract
+            first_page_num: Page number (within the processed range) of the first page
+            
+        Returns:
+            List of row dictionaries for these pages, in page order
+        """
+        rows = []
+        
+        if self.text_mode:
+            # Extract text mode: pdfminer layout only, no pdfplumber page objects
+            pages = extract_pages(
+                file_path,
+                page_numbers=[number - 1 for number in page_numbers],
+                laparams=_TEXT_LAPARAMS
+            )
+            for page_num, layout in enumerate(pages, first_page_num):
+                self.logger.debug(f"Processing page {page_num}")
+                rows.extend(self._extract_text_data(layout, page_num))
+            return rows
+        
+        with pdfplumber.open(file_path, pages=page_numbers) as pdf:
+            for page_num, page in enumerate(pdf.pages, first_page_num):
+                self.logger.debug(f"Processing page {page_num}")
+                
+                # Extract tables mode
+                page_data = self._extract_table_data(page, page_num)
+                
+                rows.extend(page_data)
+                
+                # Release pdfplumber's per-page char/object caches so memory stays flat
+                page.flush_cache()
+                page.close()
+                del page
+        
+        return rows
+    
     def _extract_table_data(self, page, page_num: int) -> List[Dict[str, Any]]:
         """
         Extract data from tables in PDF page.
@@ -105,8 +212,13 @@ class PDFStrategy(FileStrategy):
                 if not table or len(table) < 2:
                     continue
                 
-                # First row is typically headers
-                headers = table[0]
+                # First row is typically headers; normalize them once per table
+                active_columns = [
+                    (col_idx, str(header).strip().lower().replace(' ', '_'))
+                    for col_idx, header in enumerate(table[0])
+                    if header
+                ]
+                table_num = table_idx + 1
                 
                 # Process data rows
                 for row_idx, row in enumerate(table[1:], 1):
@@ -114,15 +226,13 @@ class PDFStrategy(FileStrategy):
                         continue
                     
                     # Create dictionary mapping headers to values
-                    row_dict = {}
-                    for col_idx, (header, value) in enumerate(zip(headers, row)):
-                        if header:
-                            clean_header = str(header).strip().lower().replace(' ', '_')
-                            row_dict[clean_header] = str(value).strip() if value else ''
-                    
-                    row_dict['_page'] = page_num
-                    row_dict['_table'] = table_idx + 1
-                    row_dict['_row'] = row_idx
+                    row_len = len(row)
+                    row_dict = {
+                        clean_header: str(row[col_idx]).strip() if row[col_idx] else ''
+                        for col_idx, clean_header in active_columns
+                        if col_idx < row_len
+                    }
+                    row_dict.update(_page=page_num, _table=table_num, _row=row_idx)
                     
                     page_data.append(row_dict)
             
@@ -131,12 +241,12 @@ class PDFStrategy(FileStrategy):
         
         return page_data
     
-    def _extract_text_data(self, page, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_text_data(self, layout, page_num: int) -> List[Dict[str, Any]]:
         """
         Extract data from text in PDF page.
         
         Args:
-            page: pdfplumber page object
+            layout: pdfminer LTPage layout of the page
             page_num: Page number for logging
             
         Returns:
@@ -145,7 +255,9 @@ class PDFStrategy(FileStrategy):
         page_data = []
         
         try:
-            text = page.extract_text()
+            text = ''.join(
+                element.get_text() for element in layout if isinstance(element, LTTextContainer)
+            )
             
             if not text:
                 self.logger.debug(f"No text found on page {page_num}")
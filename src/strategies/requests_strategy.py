@@ -2,17 +2,53 @@
 
 import requests
 import logging
-from typing import Dict, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from typing import Dict, Any, List
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .scraping_strategy import ScrapingStrategy
 
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:
+    httpx = None
+
+# Only advertise brotli when a decoder is installed, otherwise br bodies can't be read
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Exception families raised by whichever client backs the session
+if httpx is not None:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _HTTP_ERRORS = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _HTTP_ERRORS = (requests.exceptions.HTTPError,)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException,)
+
 
 class RequestsStrategy(ScrapingStrategy):
     """
     Scraping strategy using Python requests for static content.
     
     Use this strategy for websites that serve complete HTML content
-    without requiring JavaScript execution.
+    without requiring JavaScript execution. When httpx (with h2) is
+    installed, requests go through a pooled HTTP/2 client; otherwise a
+    requests Session is used.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -24,12 +60,21 @@ class RequestsStrategy(ScrapingStrategy):
                 - timeout: Request timeout in seconds (default: 15)
                 - user_agent: Custom user agent string
                 - headers: Additional HTTP headers
+                - http2: Use httpx over HTTP/2 when available (default: True)
+                - max_workers: Concurrent fetches in fetch_many (default: 8)
+                - max_per_host: Concurrent fetches to a single host (default: max_workers)
+                - max_retries: Retries for connection errors and 429/5xx responses (default: 3)
+                - retry_backoff_factor: Backoff factor between retries (default: 0.3)
+                - cache_enabled: Cache GET responses on disk with requests-cache (default: False)
+                - cache_ttl: Seconds cached responses stay valid (default: 3600)
         """
         super().__init__(config)
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # Configuration with defaults
         self.timeout = config.get('timeout', 15)
+        self.max_workers = config.get('max_workers', 8)
+        self.max_per_host = config.get('max_per_host', self.max_workers)
         
         # Set up headers
         self.headers = {
@@ -37,7 +82,9 @@ class RequestsStrategy(ScrapingStrategy):
                 'user_agent',
                 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
                 '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            ),
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Encoding': _ACCEPT_ENCODING
         }
         
         # Add any additional headers from config
@@ -45,8 +92,45 @@ class RequestsStrategy(ScrapingStrategy):
             self.headers.update(config['headers'])
         
         # Create session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        if config.get('cache_enabled', False):
+            import requests_cache
+            
+            self.session = requests_cache.CachedSession(
+                os.path.join('.cache', 'http'),
+                backend='sqlite',
+                expire_after=config.get('cache_ttl', 3600),
+                allowable_methods=('GET',)
+            )
+            self.session.headers.update(self.headers)
+        elif httpx is not None and config.get('http2', True):
+            # httpx transports only retry failed connection attempts
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=config.get('max_retries', 3),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            )
+            self.session = httpx.Client(
+                transport=transport,
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+        
+        if isinstance(self.session, requests.Session):
+            # Retry transient failures and size the pool for fetch_many's threads
+            retry = Retry(
+                total=config.get('max_retries', 3),
+                backoff_factor=config.get('retry_backoff_factor', 0.3),
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
         
         self.logger.info("Requests strategy initialized")
     
@@ -62,6 +146,7 @@ class RequestsStrategy(ScrapingStrategy):
             
         Raises:
             requests.exceptions.RequestException: If request fails
+            httpx.HTTPError: If request fails on the HTTP/2 client
         """
         self.logger.info(f"Fetching URL with requests: {url}")
         
@@ -69,8 +154,18 @@ class RequestsStrategy(ScrapingStrategy):
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()  # Raise exception for 4xx/5xx status codes
             
-            # Get content with proper encoding
-            html_content = response.text
+            self.logger.debug(
+                f"Content-Encoding for {url}: {response.headers.get('Content-Encoding', 'identity')}"
+            )
+            
+            # Decode with the declared charset; falling back to UTF-8 instead of
+            # response.text's chardet pass over the whole body
+            encoding = response.encoding or 'utf-8'
+            try:
+                html_content = response.content.decode(encoding, errors='replace')
+            except LookupError:
+                self.logger.debug(f"Unknown charset '{encoding}' for {url}, decoding as UTF-8")
+                html_content = response.content.decode('utf-8', errors='replace')
             
             self.logger.info(
                 f"Successfully fetched content from {url} "
@@ -79,16 +174,54 @@ class RequestsStrategy(ScrapingStrategy):
             
             return html_content
             
-        except requests.exceptions.Timeout as e:
+        except _TIMEOUT_ERRORS as e:
             self.logger.error(f"Timeout fetching {url}: {e}")
             raise
-        except requests.exceptions.HTTPError as e:
+        except _HTTP_ERRORS as e:
             self.logger.error(f"HTTP error fetching {url}: {e}")
             raise
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             self.logger.error(f"Request error fetching {url}: {e}")
             raise
     
+    def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Fetch several URLs concurrently over the shared session.
+        
+        Fetching is network-bound, so threads sharing the pooled session
+        overlap the round trips. A per-host semaphore keeps at most
+        ``max_per_host`` requests in flight against any one server.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            Dictionary mapping each successfully fetched URL to its HTML
+        """
+        if len(urls) <= 1 or self.max_workers <= 1:
+            return super().fetch_many(urls)
+        
+        pages = {}
+        host_limits = {
+            urlsplit(url).netloc: threading.BoundedSemaphore(self.max_per_host) for url in urls
+        }
+        
+        def fetch(url: str) -> str:
+            with host_limits[urlsplit(url).netloc]:
+                return self.fetch_html(url)
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            futures = {executor.submit(fetch, url): url for url in urls}
+            
+            for future in as_completed(futures):
+                try:
+                    pages[futures[future]] = future.result()
+                except Exception:
+                    # fetch_html already logged the failure
+                    continue
+        
+        return pages
+    
     def close(self) -> None:
         """Close the requests session and clean up resources."""
         try:
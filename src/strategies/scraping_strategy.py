@@ -1,7 +1,7 @@
 """Abstract base class for scraping strategies."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class ScrapingStrategy(ABC):
@@ -37,6 +37,31 @@ class ScrapingStrategy(ABC):
         """
         pass
     
+    def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Fetch HTML content for several URLs.
+        
+        The default implementation fetches sequentially; strategies whose
+        client is safe to share across threads can override it.
+        URLs that fail are logged and left out of the result.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            Dictionary mapping each successfully fetched URL to its HTML
+        """
+        pages = {}
+        
+        for url in urls:
+            try:
+                pages[url] = self.fetch_html(url)
+            except Exception:
+                # fetch_html already logged the failure
+                continue
+        
+        return pages
+    
     @abstractmethod
     def close(self) -> None:
         """
@@ -1,8 +1,10 @@
 """Selenium-based scraping strategy for dynamic websites."""
 
+import atexit
+import threading
 import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, FrozenSet, List
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,12 +13,62 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from .scraping_strategy import ScrapingStrategy
 
+# Idle Chrome drivers keyed by their option arguments, reused by later strategies
+_DRIVER_POOL: Dict[FrozenSet[str], List[webdriver.Chrome]] = {}
+_DRIVER_POOL_LOCK = threading.Lock()
+
+
+def _quit_pooled_drivers() -> None:
+    """Quit every idle pooled driver at interpreter exit."""
+    with _DRIVER_POOL_LOCK:
+        drivers = [driver for idle in _DRIVER_POOL.values() for driver in idle]
+        _DRIVER_POOL.clear()
+    
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_quit_pooled_drivers)
+
+# Resources not needed to read the rendered HTML
+_BLOCKED_RESOURCE_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.css'
+]
+
+# Scroll to the bottom and follow page growth until the height settles.
+# Arguments: settle time (ms), hard limit (ms), completion callback.
+_SCROLL_SCRIPT = """
+const settleMs = arguments[0], maxMs = arguments[1], done = arguments[arguments.length - 1];
+let last = document.body.scrollHeight;
+let settleTimer, maxTimer;
+const finish = () => { observer.disconnect(); clearTimeout(settleTimer); clearTimeout(maxTimer); done(last); };
+const observer = new MutationObserver(() => {
+    const height = document.body.scrollHeight;
+    if (height !== last) {
+        last = height;
+        window.scrollTo(0, height);
+        clearTimeout(settleTimer);
+        settleTimer = setTimeout(finish, settleMs);
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, last);
+settleTimer = setTimeout(finish, settleMs);
+maxTimer = setTimeout(finish, maxMs);
+"""
+
 
 class SeleniumStrategy(ScrapingStrategy):
     """
     Scraping strategy using Selenium WebDriver for dynamic content.
     
     Use this strategy for websites that load content dynamically with JavaScript.
+    Chrome instances are pooled per option set: ``close()`` hands the driver
+    back to the pool so the next strategy skips browser startup.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -28,7 +80,17 @@ class SeleniumStrategy(ScrapingStrategy):
                 - headless: Run browser in headless mode (default: True)
                 - wait_time: Max wait time for elements (default: 30)
                 - scroll_attempts: Number of scroll attempts (default: 3)
-                - scroll_delay: Delay between scrolls in seconds (default: 2)
+                - scroll_delay: Delay between scrolls in seconds (default: 2);
+                  scrolling stops after scroll_attempts * scroll_delay seconds at most
+                - block_resources: Skip image/font/CSS downloads (default: True);
+                  disable for sites whose content depends on CSS
+                - scroll_settle_time: Seconds the page height must stay unchanged
+                  before scrolling stops (default: 0.3)
+                - network_idle_time: Seconds without new resource requests that
+                  count as loaded (default: 0.5)
+                - network_idle_timeout: Max seconds to wait for network idle after
+                  the document has loaded; pages that never go idle (analytics
+                  beacons, polling) proceed after this (default: 3)
         """
         super().__init__(config)
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -38,13 +100,18 @@ class SeleniumStrategy(ScrapingStrategy):
         self.wait_time = config.get('wait_time', 30)
         self.scroll_attempts = config.get('scroll_attempts', 3)
         self.scroll_delay = config.get('scroll_delay', 2)
+        self.network_idle_time = config.get('network_idle_time', 0.5)
+        self.network_idle_timeout = config.get('network_idle_timeout', 3)
+        self.scroll_settle_time = config.get('scroll_settle_time', 0.3)
+        self.block_resources = config.get('block_resources', True)
         
         # Initialize WebDriver
         self.driver = None
+        self._pool_key: FrozenSet[str] = frozenset()
         self._init_driver()
     
     def _init_driver(self) -> None:
-        """Initialize Selenium WebDriver with Chrome."""
+        """Take a pooled WebDriver with the same options, or start a new Chrome."""
         try:
             options = webdriver.ChromeOptions()
             
@@ -56,13 +123,41 @@ class SeleniumStrategy(ScrapingStrategy):
             options.add_argument('--disable-gpu')
             options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
             
+            self._pool_key = frozenset(options.arguments)
+            
+            with _DRIVER_POOL_LOCK:
+                idle = _DRIVER_POOL.get(self._pool_key, [])
+                driver = idle.pop() if idle else None
+            
+            if driver is not None:
+                try:
+                    driver.current_url  # Raises if the browser died while idle
+                    self.driver = driver
+                    self._apply_resource_blocking()
+                    self.logger.info(f"Reusing pooled WebDriver (headless={self.headless})")
+                    return
+                except WebDriverException:
+                    self.logger.debug("Discarding dead pooled WebDriver")
+            
             self.driver = webdriver.Chrome(options=options)
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self._apply_resource_blocking()
             self.logger.info(f"WebDriver initialized (headless={self.headless})")
             
         except WebDriverException as e:
             self.logger.error(f"Failed to initialize WebDriver: {e}")
             raise
     
+    def _apply_resource_blocking(self) -> None:
+        """
+        Block (or unblock) image, font and stylesheet downloads via CDP.
+        
+        Applied on every checkout since pooled drivers keep the previous
+        strategy's blocklist.
+        """
+        urls = _BLOCKED_RESOURCE_URLS if self.block_resources else []
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    
     def fetch_html(self, url: str) -> str:
         """
         Fetch HTML content using Selenium.
@@ -91,7 +186,7 @@ class SeleniumStrategy(ScrapingStrategy):
             
             # Wait for initial content to load
             # Note: Supplier implementations should override this with specific selectors
-            time.sleep(3)  # Basic wait for page load
+            self._wait_for_page_ready()
             
             # Scroll to load dynamic content
             self._scroll_page()
@@ -109,6 +204,74 @@ class SeleniumStrategy(ScrapingStrategy):
             self.logger.error(f"WebDriver error at {url}: {e}")
             raise
     
+    def fetch_many(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Fetch several URLs with the same browser, each in a fresh tab.
+        
+        Tabs share the browser profile and cache; each one is closed after
+        its HTML is read. URLs that fail are logged and left out of the result.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            Dictionary mapping each successfully fetched URL to its HTML
+        """
+        if self.driver is None:
+            raise RuntimeError("WebDriver not initialized")
+        
+        pages = {}
+        main_handle = self.driver.current_window_handle
+        
+        for url in urls:
+            try:
+                self.driver.switch_to.new_window('tab')
+                pages[url] = self.fetch_html(url)
+            except WebDriverException:
+                # fetch_html already logged the failure
+                continue
+            finally:
+                if self.driver.current_window_handle != main_handle:
+                    self.driver.close()
+                self.driver.switch_to.window(main_handle)
+        
+        return pages
+    
+    def _wait_for_page_ready(self) -> None:
+        """
+        Wait until the document has loaded and resource requests have settled.
+        
+        Waits for ``document.readyState == 'complete'``, then polls the
+        number of resource timing entries until it stays unchanged for
+        ``network_idle_time`` seconds. The idle phase gives up after
+        ``network_idle_timeout`` seconds, so pages with continuous background
+        requests cost no more than the old fixed sleep.
+        
+        Raises:
+            TimeoutException: If the document doesn't load within wait_time
+        """
+        WebDriverWait(self.driver, self.wait_time).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        
+        deadline = time.monotonic() + self.network_idle_timeout
+        last_count = -1
+        stable_since = time.monotonic()
+        
+        while time.monotonic() < deadline:
+            count = self.driver.execute_script(
+                "return performance.getEntriesByType('resource').length"
+            )
+            now = time.monotonic()
+            
+            if count != last_count:
+                last_count = count
+                stable_since = now
+            elif now - stable_since >= self.network_idle_time:
+                break
+            
+            time.sleep(0.1)
+    
     def wait_for_element(self, selector: str, by: By = By.CSS_SELECTOR) -> None:
         """
         Wait for a specific element to appear on the page.
@@ -132,41 +295,37 @@ class SeleniumStrategy(ScrapingStrategy):
         """
         Scroll page to trigger lazy loading of content.
         
-        Performs multiple scroll attempts with delays to ensure
-        all dynamic content is loaded.
+        Runs a single async script: it scrolls to the bottom, keeps scrolling
+        whenever a MutationObserver sees the page grow, and finishes once the
+        height has been stable for ``scroll_settle_time`` seconds, or after
+        ``scroll_attempts * scroll_delay`` seconds at most.
         """
         if self.driver is None:
             return
         
-        self.logger.debug(f"Scrolling page ({self.scroll_attempts} attempts)")
-        
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        max_ms = int(self.scroll_attempts * self.scroll_delay * 1000)
+        self.logger.debug(f"Scrolling page (up to {max_ms} ms)")
         
-        for attempt in range(self.scroll_attempts):
-            # Scroll to bottom
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            # Wait for content to load
-            time.sleep(self.scroll_delay)
-            
-            # Check if page height changed (new content loaded)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            if new_height == last_height:
-                self.logger.debug(f"Page height unchanged after scroll {attempt + 1}, stopping")
-                break
-            
-            last_height = new_height
+        self.driver.set_script_timeout(max_ms / 1000 + 5)
+        final_height = self.driver.execute_async_script(
+            _SCROLL_SCRIPT, int(self.scroll_settle_time * 1000), max_ms
+        )
         
-        self.logger.debug("Scrolling completed")
+        self.logger.debug(f"Scrolling completed (page height {final_height})")
     
     def close(self) -> None:
-        """Close the WebDriver and clean up resources."""
+        """Return the WebDriver to the pool (quit at interpreter exit)."""
         if self.driver is not None:
             try:
-                self.driver.quit()
-                self.logger.info("WebDriver closed")
+                self.driver.get('about:blank')
+                with _DRIVER_POOL_LOCK:
+                    _DRIVER_POOL.setdefault(self._pool_key, []).append(self.driver)
+                self.logger.info("WebDriver returned to pool")
             except Exception as e:
-                self.logger.error(f"Error closing WebDriver: {e}")
+                self.logger.error(f"Error releasing WebDriver, quitting it: {e}")
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
             finally:
                 self.driver = None
@@ -1,13 +1,90 @@
 """Distribuidora De Marchi scraper implementation."""
 
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+import logging
 import re
+from functools import lru_cache
+
+from lxml import html
 
 from ..core.scraper_base import ScraperBase
 from ..core.parser import DataParser
 from ..strategies import RequestsStrategy
+from ..utils.html_utils import HTML_PARSER, compile_selector, stripped_text
+
+# Image attributes in lookup order (lazy-loading attributes first)
+_IMG_ATTRS = ('data-srcset', 'data-src', 'src')
+
+# " x " separating the product name from its quantity ("Aceite x 900ml", "Queso x -kg")
+_X_QTY_RE = re.compile(r'\s+x\s*(?=\d|[–-])', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _parse_demarchi_title_cached(title: str, supplier_name: str) -> tuple:
+    """
+    Parse De Marchi product title to extract name, brand, and full title for units.
+    
+    Cached at module level since titles repeat across paginated/category pages.
+    
+    De Marchi format: "Product Name Brand x 500 g – Description"
+    - Product name: Everything before the last word before 'x'
+    - Brand: Last word before 'x'
+    - Full title: Used for parsing units and quantity
+    
+    Examples:
+        "Aderezo Caesar Abedul x 20 g – Pack x108 unidades"
+        -> name: "Aderezo Caesar", brand: "Abedul"
+        
+        "Aderezo Caesar Abedul x20 g – Pack x108 unidades"
+        -> name: "Aderezo Caesar", brand: "Abedul"
+        
+        "Aderezo Caesar Abedul x – Pack x108 unidades"
+        -> name: "Aderezo Caesar", brand: "Abedul"
+        
+        "Chipa Congelado x 5 kg – Formato mayorista"
+        -> name: "Chipa", brand: "Congelado", units from "x 5 kg"
+    
+    Args:
+        title: Raw product title
+        supplier_name: Brand used when the title has no brand word
+        
+    Returns:
+        Tuple of (product_name, brand, full_title)
+    """
+    # Find the FIRST position of 'x' followed by:
+    # - a digit (with or without space): " x20", " x 20"
+    # - or a dash/separator: " x –", " x -"
+    # This ensures we match the x that indicates quantity, not other x's in the text
+    # (titles without any x can't match, so skip the regex for them)
+    x_match = _X_QTY_RE.search(title) if 'x' in title or 'X' in title else None
+    
+    if x_match:
+        # Get everything before ' x'
+        before_x = title[:x_match.start()].strip()
+        
+        # Split by spaces to separate product name and brand
+        words = before_x.split()
+        
+        if len(words) >= 2:
+            # Last word before 'x' is the brand
+            brand = words[-1]
+            # Everything else is the product name
+            product_name = ' '.join(words[:-1])
+        elif len(words) == 1:
+            # Only one word, use it as product name, brand is supplier name
+            product_name = words[0]
+            brand = supplier_name
+        else:
+            # Empty before x, use full title
+            product_name = title
+            brand = supplier_name
+    else:
+        # No 'x' found, use full title as product name
+        product_name = title
+        brand = supplier_name
+    
+    return product_name, brand, title
 
 
 class DistribuidoraDeMarchiScraper(ScraperBase):
@@ -18,6 +95,9 @@ class DistribuidoraDeMarchiScraper(ScraperBase):
     Only products with the "agregar al carrito" button have prices and should be scraped.
     """
     
+    # Category pages are fetched concurrently, then extracted in URL order
+    prefetch_urls = True
+    
     def __init__(self, config: Dict[str, Any], api_client: 'APIClient'):
         """
         Initialize Distribuidora De Marchi scraper.
@@ -35,33 +115,66 @@ class DistribuidoraDeMarchiScraper(ScraperBase):
         # Get selectors from config
         self.selectors = config.get('selectors', {})
         
+        # Compile CSS selectors to XPath once; matched against each product item
+        self._sel_products = compile_selector(self.selectors, 'product_list', '.js-item-product')
+        self._sel_button = compile_selector(self.selectors, 'button', '.js-addtocart')
+        self._sel_title = compile_selector(self.selectors, 'title', '.js-item-name')
+        self._sel_price = compile_selector(self.selectors, 'price', '.js-price-display')
+        self._sel_image = compile_selector(self.selectors, 'image', '.js-item-image')
+        
         # Initialize parser
         self.parser = DataParser()
         
+        # Supplier info
+        self._brand = config.get('supplier_name', 'Distribuidora De Marchi')
+        self._supplier_id = config.get('supplier_id', 0)
+        
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
+        
         # Base URL for resolving relative paths
         self.base_url = 'https://www.distribuidorademarchi.com.ar'
     
-    def _parse_demarchi_title(self, title: str) -> tuple:
+    def _image_url(self, image_element: html.HtmlElement) -> str:
         """
-        Parse De Marchi product title to extract name, brand, and full title for units.
+        Get the absolute URL of a product image.
         
-        De Marchi format: "Product Name Brand x 500 g – Description"
-        - Product name: Everything before the last word before 'x'
-        - Brand: Last word before 'x'
-        - Full title: Used for parsing units and quantity
+        Tiendanube uses lazy loading, so the first non-empty of
+        data-srcset, data-src and src is used.
         
-        Examples:
-            "Aderezo Caesar Abedul x 20 g – Pack x108 unidades"
-            -> name: "Aderezo Caesar", brand: "Abedul"
-            
-            "Aderezo Caesar Abedul x20 g – Pack x108 unidades"
-            -> name: "Aderezo Caesar", brand: "Abedul"
-            
-            "Aderezo Caesar Abedul x – Pack x108 unidades"
-            -> name: "Aderezo Caesar", brand: "Abedul"
+        Args:
+            image_element: Product image element
             
-            "Chipa Congelado x 5 kg – Formato mayorista"
-            -> name: "Chipa", brand: "Congelado", units from "x 5 kg"
+        Returns:
+            Absolute image URL, or '' if the element has none
+        """
+        for attr in _IMG_ATTRS:
+            image_url = image_element.get(attr)
+            if image_url:
+                break
+        else:
+            return ''
+        
+        # data-srcset might have multiple URLs with sizes, take the first one
+        if ' ' in image_url:
+            image_url = image_url.split(None, 1)[0]
+        
+        # Ensure absolute URL
+        if not image_url.startswith('http'):
+            # Add https: if it starts with //
+            if image_url.startswith('//'):
+                image_url = 'https:' + image_url
+            elif image_url.startswith('/') and '/.' not in image_url:
+                # Root-relative path: base_url is a bare origin, so just prepend it
+                image_url = self.base_url + image_url
+            else:
+                image_url = urljoin(self.base_url, image_url)
+        
+        return image_url
+    
+    def _parse_demarchi_title(self, title: str) -> tuple:
+        """
+        Parse De Marchi product title (see ``_parse_demarchi_title_cached``).
         
         Args:
             title: Raw product title
@@ -69,38 +182,9 @@ class DistribuidoraDeMarchiScraper(ScraperBase):
         Returns:
             Tuple of (product_name, brand, full_title)
         """
-        # Find the FIRST position of 'x' followed by:
-        # - a digit (with or without space): " x20", " x 20"
-        # - or a dash/separator: " x –", " x -"
-        # This ensures we match the x that indicates quantity, not other x's in the text
-        x_match = re.search(r'\s+x\s*(?=\d|[–-])', title, re.IGNORECASE)
-        
-        if x_match:
-            # Get everything before ' x'
-            before_x = title[:x_match.start()].strip()
-            
-            # Split by spaces to separate product name and brand
-            words = before_x.split()
-            
-            if len(words) >= 2:
-                # Last word before 'x' is the brand
-                brand = words[-1]
-                # Everything else is the product name
-                product_name = ' '.join(words[:-1])
-            elif len(words) == 1:
-                # Only one word, use it as product name, brand is supplier name
-                product_name = words[0]
-                brand = self.config.get('supplier_name', 'Distribuidora De Marchi')
-            else:
-                # Empty before x, use full title
-                product_name = title
-                brand = self.config.get('supplier_name', 'Distribuidora De Marchi')
-        else:
-            # No 'x' found, use full title as product name
-            product_name = title
-            brand = self.config.get('supplier_name', 'Distribuidora De Marchi')
-        
-        return product_name, brand, title
+        return _parse_demarchi_title_cached(title, self._brand)
+    
+    def get_urls(self) -> List[str]:
         """Get list of URLs to scrape from configuration."""
         return self.config.get('urls', [])
     
@@ -130,84 +214,72 @@ class DistribuidoraDeMarchiScraper(ScraperBase):
         Returns:
             List of product dictionaries
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        root = html.fromstring(html_content, parser=HTML_PARSER)
         products = []
         
         # Find all product items using Tiendanube class
-        product_selector = self.selectors.get('product_list', '.js-item-product')
-        product_items = soup.select(product_selector)
+        product_items = self._sel_products(root)
         
         self.logger.info(f"Found {len(product_items)} product items on page")
         
+        # Bind per-page constants and hot callables to locals for the product loop
+        sel_button, sel_title, sel_price, sel_image = (
+            self._sel_button, self._sel_title, self._sel_price, self._sel_image
+        )
+        text_of = stripped_text
+        clean_price = self._clean_price
+        parse_title = self.parser.parse_product_title
+        supplier_id = self._supplier_id
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        
         for item in product_items:
             try:
                 # IMPORTANT: Only process products with "agregar al carrito" button
-                button_selector = self.selectors.get('button', '.js-addtocart')
-                button = item.select_one(button_selector)
-                
-                if not button:
+                if not sel_button(item):
                     # Skip products without the "agregar al carrito" button (no price)
                     continue
                 
                 # Extract title
-                title_selector = self.selectors.get('title', '.js-item-name')
-                title_element = item.select_one(title_selector)
+                title_elements = sel_title(item)
                 
                 # Extract price
-                price_selector = self.selectors.get('price', '.js-price-display')
-                price_element = item.select_one(price_selector)
+                price_elements = sel_price(item)
                 
                 # Extract image
-                image_selector = self.selectors.get('image', '.js-item-image')
-                image_element = item.select_one(image_selector)
+                image_elements = sel_image(item)
                 
                 # Validate required fields
-                if not title_element or not price_element:
+                if not title_elements or not price_elements:
                     self.logger.warning("Missing title or price, skipping product")
                     continue
                 
                 # Get text content
-                title = title_element.get_text(strip=True)
-                price_text = price_element.get_text(strip=True)
+                title = text_of(title_elements[0])
+                price_text = text_of(price_elements[0])
                 
                 # Skip empty titles
                 if not title:
                     continue
                 
-                # Parse price using configured format
-                price_format = self.config.get('price_format', {})
-                price, formatted_price = self.parser.clean_price(price_text, price_format)
+                # Parse price using configured format ("Consultar"-style placeholders
+                # have no digits and would parse to 0, so skip the cleaner for them)
+                if any(c.isdigit() for c in price_text):
+                    price, formatted_price = clean_price(price_text)
+                else:
+                    price, formatted_price = 0.0, price_text
                 
                 # Extract image URL
-                image_url = ''
-                if image_element:
-                    # Tiendanube uses lazy loading with data-srcset
-                    image_url = (
-                        image_element.get('data-srcset', '') or
-                        image_element.get('data-src', '') or
-                        image_element.get('src', '')
-                    )
-                    
-                    # data-srcset might have multiple URLs with sizes, take the first one
-                    if image_url and ' ' in image_url:
-                        image_url = image_url.split()[0]
-                    
-                    # Ensure absolute URL
-                    if image_url and not image_url.startswith('http'):
-                        # Add https: if it starts with //
-                        if image_url.startswith('//'):
-                            image_url = 'https:' + image_url
-                        else:
-                            image_url = urljoin(self.base_url, image_url)
+                image_url = self._image_url(image_elements[0]) if image_elements else ''
                 
                 # Parse De Marchi title to extract product name and brand
                 product_name, brand, full_title = self._parse_demarchi_title(title)
                 
                 # Parse the full title to extract quantity and unit
                 # The parser will use the full title (with "x N unit") to get units
-                _, quantity, unit = self.parser.parse_product_title(full_title)
+                _, quantity, unit = parse_title(full_title)
                 
-                self.logger.debug(f"Parsed '{title}' -> Name: '{product_name}', Brand: '{brand}', {quantity} {unit}")
+                if debug:
+                    self.logger.debug(f"Parsed '{title}' -> Name: '{product_name}', Brand: '{brand}', {quantity} {unit}")
                 
                 # Build product dictionary
                 product = {
@@ -218,7 +290,7 @@ class DistribuidoraDeMarchiScraper(ScraperBase):
                     'quantity': quantity,
                     'unit': unit,
                     'image': image_url,
-                    'supplierId': self.config.get('supplier_id', 0),
+                    'supplierId': supplier_id,
                 }
                 
                 products.append(product)
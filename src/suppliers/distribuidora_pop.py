@@ -36,6 +36,9 @@ class DistribuidoraPopScraper(ScraperBase):
         
         # Initialize parser
         self.parser = DataParser()
+        
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
     
     def get_urls(self) -> List[str]:
         """Get list of URLs to scrape from configuration."""
@@ -112,8 +115,7 @@ class DistribuidoraPopScraper(ScraperBase):
         price_text = price_tag.text.strip() if price_tag else "$0"
         
         # Clean and convert price using custom format from config
-        price_format = self.config.get('price_format', {})
-        price, _ = self.parser.clean_price(price_text, price_format)
+        price, _ = self._clean_price(price_text)
         
         if price == 0.0:
             return None
@@ -144,8 +146,3 @@ class DistribuidoraPopScraper(ScraperBase):
         }
         
         return product
-    
-    def __del__(self):
-        """Clean up strategy resources."""
-        if hasattr(self, 'strategy'):
-            self.strategy.close()
@@ -1,10 +1,11 @@
 """El Chañar Carnes scraper for Excel price lists."""
 
 import logging
-from typing import List, Dict
+from typing import List, Dict, Any, Optional, Union
 import json
 
 from ..core.scraper_base import ScraperBase
+from ..core.parser import DataParser
 from ..strategies.excel_strategy import ExcelStrategy
 
 
@@ -34,11 +35,6 @@ class ElChanarCarnesScraper(ScraperBase):
         self.filename = self.file_config.get('filename')
         self.input_dir = self.file_config.get('input_dir', 'input')
         
-        # Excel strategy
-        excel_config = config.get('excel_config', {})
-        excel_config['input_dir'] = self.input_dir
-        self.strategy = ExcelStrategy(excel_config)
-        
         # Column mapping
         self.column_mapping = config.get('column_mapping', {})
         self.name_columns = self.column_mapping.get('name_columns', [0])
@@ -47,6 +43,27 @@ class ElChanarCarnesScraper(ScraperBase):
         
         # Price format
         self.price_format = config.get('price_format', {})
+        self._clean_price = DataParser.make_price_cleaner(self.price_format)
+        
+        # Excel strategy
+        excel_config = config.get('excel_config', {})
+        excel_config['input_dir'] = self.input_dir
+        
+        # With pandas and positional columns (header_row: null) the strategy
+        # cleans price columns in bulk, leaving plain "1234.56" strings for _parse_price
+        self.prices_precleaned = (
+            excel_config.get('use_pandas', True) and excel_config.get('header_row', 0) is None
+        )
+        if self.prices_precleaned:
+            excel_config.setdefault('price_columns', self.price_columns)
+            excel_config.setdefault('price_format', self.price_format)
+        
+        self.strategy = ExcelStrategy(excel_config)
+        
+        # Positional-key fallback for rows keyed by neither col_index nor str(col_index):
+        # digit-like keys in sorted order, rebuilt only when the row key set changes
+        self._digit_keys_for: Optional[set] = None
+        self._digit_keys: List[Any] = []
         
         self.logger.info(f"Excel scraper initialized for file: {self.filename}")
     
@@ -59,7 +76,7 @@ class ElChanarCarnesScraper(ScraperBase):
         """
         return [self.filename]
     
-    def _fetch_html(self, filename: str) -> str:
+    def _fetch_html(self, filename: str) -> List[Dict]:
         """
         Extract data from Excel file.
         
@@ -67,21 +84,21 @@ class ElChanarCarnesScraper(ScraperBase):
             filename: Name of Excel file
             
         Returns:
-            JSON string of extracted data
+            Extracted row dictionaries, handed to extract_products as-is
         """
         file_path = self.strategy.get_file_path(filename)
         raw_data = self.strategy.extract_data(file_path)
         
         self.logger.info(f"Extracted {len(raw_data)} raw records from Excel")
         
-        return json.dumps(raw_data)
+        return raw_data
     
-    def extract_products(self, json_content: str, filename: str) -> List[Dict]:
+    def extract_products(self, raw_data: Union[List[Dict], str], filename: str) -> List[Dict]:
         """
         Process extracted Excel data into product format.
         
         Args:
-            json_content: JSON string of raw extracted data
+            raw_data: Extracted row dictionaries (or their JSON string)
             filename: Source filename for logging
             
         Returns:
@@ -90,7 +107,8 @@ class ElChanarCarnesScraper(ScraperBase):
         products = []
         
         try:
-            raw_data = json.loads(json_content)
+            if isinstance(raw_data, str):
+                raw_data = json.loads(raw_data)
             
             self.logger.info(f"Processing {len(raw_data)} raw records in {self.process_mode} mode")
             
@@ -184,7 +202,12 @@ class ElChanarCarnesScraper(ScraperBase):
             return str(row[str_key]).strip()
         
         # Try to get from ordered keys
-        keys = sorted([k for k in row.keys() if isinstance(k, (int, str)) and str(k).isdigit()])
+        row_keys = row.keys()
+        if row_keys != self._digit_keys_for:
+            self._digit_keys = sorted([k for k in row_keys if isinstance(k, (int, str)) and str(k).isdigit()])
+            self._digit_keys_for = set(row_keys)
+        
+        keys = self._digit_keys
         if col_index < len(keys):
             key = keys[col_index]
             return str(row[key]).strip()
@@ -242,10 +265,14 @@ class ElChanarCarnesScraper(ScraperBase):
         Returns:
             Price as float
         """
-        from ..core.parser import DataParser
+        if self.prices_precleaned:
+            try:
+                return float(price_str)
+            except ValueError:
+                return 0.0
         
         try:
-            price, _ = DataParser.clean_price(price_str, self.price_format)
+            price, _ = self._clean_price(price_str)
             return price
         except Exception:
             return 0.0
@@ -1,12 +1,23 @@
 """Green Shop scraper implementation."""
 
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin, urlsplit
+from functools import lru_cache
+
+from lxml import html
 
 from ..core.scraper_base import ScraperBase
 from ..core.parser import DataParser
 from ..strategies import RequestsStrategy
+from ..utils.html_utils import HTML_PARSER_KEEP_BLANK, compile_selector
+
+# Per-product field selectors and their defaults
+_FIELD_SELECTORS = {
+    'status': '.out-of-stock-label',
+    'title': '.product-title a',
+    'price': '.price .amount',
+    'image': '.box-image img'
+}
 
 
 class GreenShopScraper(ScraperBase):
@@ -17,6 +28,9 @@ class GreenShopScraper(ScraperBase):
     requests-based strategy instead of Selenium.
     """
     
+    # Category pages are fetched concurrently, then extracted in URL order
+    prefetch_urls = True
+    
     def __init__(self, config: Dict[str, Any], api_client: 'APIClient'):
         """
         Initialize Green Shop scraper.
@@ -36,6 +50,52 @@ class GreenShopScraper(ScraperBase):
         
         # Initialize parser
         self.parser = DataParser()
+        
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
+        
+        # Supplier info
+        self._brand = config['supplier_name']
+        self._supplier_id = config['supplier_id']
+        
+        # Compile CSS selectors to XPath once: product cards against the page,
+        # field selectors against each card
+        self._product_list = compile_selector(
+            self.selectors, 'product_list', '.product-small', prefix='descendant-or-self::'
+        )
+        self._fields = {
+            field: compile_selector(self.selectors, field, default)
+            for field, default in _FIELD_SELECTORS.items()
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _origin(url: str) -> str:
+        """
+        Get the scheme and host part of a URL (e.g. "https://greenshop.ar").
+        
+        Args:
+            url: Absolute URL
+            
+        Returns:
+            URL origin without trailing slash
+        """
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+    
+    def _first(self, field: str, item: html.HtmlElement) -> Optional[html.HtmlElement]:
+        """
+        Get the first element inside a product card matching a field selector.
+        
+        Args:
+            field: Field name (key of ``_FIELD_SELECTORS``)
+            item: Product card element
+            
+        Returns:
+            First matching element, or None if there is none
+        """
+        matches = self._fields[field](item)
+        return matches[0] if matches else None
     
     def get_urls(self) -> List[str]:
         """Get list of URLs to scrape from configuration."""
@@ -56,13 +116,13 @@ class GreenShopScraper(ScraperBase):
         Returns:
             List of product dictionaries
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        root = html.fromstring(html_content, parser=HTML_PARSER_KEEP_BLANK)
         
         # Find all product items
-        product_selector = self.selectors.get('product_list', '.product-small')
-        product_items = soup.select(product_selector)
+        product_items = self._product_list(root)
         
         if not product_items:
+            product_selector = self.selectors.get('product_list', '.product-small')
             self.logger.warning(f"No products found with selector '{product_selector}'")
             return []
         
@@ -82,28 +142,26 @@ class GreenShopScraper(ScraperBase):
         
         return products
     
-    def _extract_single_product(self, item: BeautifulSoup, base_url: str) -> Dict[str, Any]:
+    def _extract_single_product(self, item: html.HtmlElement, base_url: str) -> Dict[str, Any]:
         """
         Extract data from a single product element.
         
         Args:
-            item: BeautifulSoup element for product
+            item: lxml element for product
             base_url: Base URL for constructing image URLs
             
         Returns:
             Product dictionary or None if invalid
         """
         # Check stock status
-        status_selector = self.selectors.get('status', '.out-of-stock-label')
-        is_out_of_stock = item.select_one(status_selector) is not None
+        is_out_of_stock = self._first('status', item) is not None
         
         if is_out_of_stock:
             return None
         
         # Extract title
-        title_selector = self.selectors.get('title', '.product-title a')
-        title_tag = item.select_one(title_selector)
-        full_title = title_tag.text.strip() if title_tag else "N/A"
+        title_tag = self._first('title', item)
+        full_title = title_tag.text_content().strip() if title_tag is not None else "N/A"
         
         if full_title == "N/A":
             return None
@@ -112,45 +170,45 @@ class GreenShopScraper(ScraperBase):
         name, quantity, unit = self.parser.parse_product_title(full_title)
         
         # Extract price
-        price_selector = self.selectors.get('price', '.price .amount')
-        price_tag = item.select_one(price_selector)
-        price_text = price_tag.text.strip() if price_tag else "$0"
+        price_tag = self._first('price', item)
+        price_text = price_tag.text_content().strip() if price_tag is not None else "$0"
+        
+        # Missing or placeholder prices parse to 0 and get dropped anyway
+        if price_text == "$0" or not any(c.isdigit() for c in price_text):
+            return None
         
         # Clean and convert price using custom format from config
-        price_format = self.config.get('price_format', {})
-        price, _ = self.parser.clean_price(price_text, price_format)
+        price, _ = self._clean_price(price_text)
         
         if price == 0.0:
             return None
         
         # Extract image
-        image_selector = self.selectors.get('image', '.box-image img')
-        img_tag = item.select_one(image_selector)
+        img_tag = self._first('image', item)
         image_url = ""
         
-        if img_tag:
+        if img_tag is not None:
             # Check data-src first (lazy loading), then src
             image_url = img_tag.get('data-src') or img_tag.get('src', '')
             
             # Convert relative URLs to absolute
             if image_url and image_url.startswith('/'):
-                image_url = urljoin(base_url, image_url)
+                if image_url.startswith('//') or '/.' in image_url:
+                    image_url = urljoin(base_url, image_url)
+                else:
+                    # Root-relative path: prepend the page's scheme and host
+                    image_url = self._origin(base_url) + image_url
         
         # Build product dictionary
         product = {
             'name': name,
-            'brand': self.config['supplier_name'],
+            'brand': self._brand,
             'description': name,
             'price': price,
             'image': image_url,
             'unit': unit,
             'quantity': quantity,
-            'supplierId': self.config['supplier_id']
+            'supplierId': self._supplier_id
         }
         
         return product
-    
-    def __del__(self):
-        """Clean up strategy resources."""
-        if hasattr(self, 'strategy'):
-            self.strategy.close()
@@ -1,12 +1,41 @@
 """Irlanda supplier scraper for PDF price lists."""
 
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
 import re
 
 from ..core.scraper_base import ScraperBase
+from ..core.parser import DataParser
 from ..strategies.pdf_strategy import PDFStrategy
 
+# Irlanda text lines: "CODE DESCRIPTION.......... PRICE"
+_LINE_PRICE_RE = re.compile(r'[.\s]+(\d{1,3}(?:\.\d{3})*(?:,\d{2})?|\d+\.\d{2})\s*$')
+_DOT_FILLER_RE = re.compile(r'\.{2,}')
+_LINE_CODE_RE = re.compile(r'^(\d{5,7})\s+')
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+
+# Header/footer markers of the text-mode price list, matched anywhere in a
+# lowercased line (re.IGNORECASE would lose the literal-prefix fast path)
+_HEADER_SKIP_RE = re.compile(r'página|lista|código|descripción|═══|───|cuit:|direc:|tel:')
+
+# Unit spellings in Irlanda rows -> standardized unit
+_UNIT_MAP = {
+    'KG': 'KG',
+    'KILO': 'KG',
+    'KILOS': 'KG',
+    'GR': 'G',
+    'GRAMO': 'G',
+    'GRAMOS': 'G',
+    'L': 'L',
+    'LITRO': 'L',
+    'LITROS': 'L',
+    'ML': 'ML',
+    'CC': 'ML',
+    'UN': 'UNIT',
+    'UND': 'UNIT',
+    'UNIDAD': 'UNIT'
+}
+
 
 class IrlandaScraper(ScraperBase):
     """
@@ -44,6 +73,16 @@ class IrlandaScraper(ScraperBase):
         
         # Price format
         self.price_format = config.get('price_format', {})
+        self._clean_price = DataParser.make_price_cleaner(self.price_format)
+        
+        # Supplier info
+        self._brand = config['supplier_name']
+        self._supplier_id = config['supplier_id']
+        
+        # Row keys matching each column_mapping alias list (exact, then partial),
+        # resolved once per row key set instead of rescanning every row
+        self._column_keys_for: Optional[set] = None
+        self._column_keys: Dict[Tuple[str, ...], Tuple[List[str], List[str]]] = {}
         
         self.logger.info(f"Irlanda PDF scraper initialized for file: {self.filename}")
     
@@ -56,7 +95,7 @@ class IrlandaScraper(ScraperBase):
         """
         return [self.filename]
     
-    def _fetch_html(self, filename: str) -> str:
+    def _fetch_html(self, filename: str) -> List[Dict]:
         """
         Extract data from PDF file.
         
@@ -64,23 +103,21 @@ class IrlandaScraper(ScraperBase):
             filename: Name of PDF file
             
         Returns:
-            JSON string of extracted data
+            Extracted row dictionaries, handed to extract_products as-is
         """
-        import json
-        
         file_path = self.strategy.get_file_path(filename)
         raw_data = self.strategy.extract_data(file_path)
         
         self.logger.info(f"Extracted {len(raw_data)} raw records from PDF")
         
-        return json.dumps(raw_data)
+        return raw_data
     
-    def extract_products(self, json_content: str, filename: str) -> List[Dict]:
+    def extract_products(self, raw_data: Union[List[Dict], str], filename: str) -> List[Dict]:
         """
         Process extracted PDF data into product format.
         
         Args:
-            json_content: JSON string of raw extracted data
+            raw_data: Extracted row dictionaries (or their JSON string)
             filename: Source filename for logging
             
         Returns:
@@ -91,7 +128,8 @@ class IrlandaScraper(ScraperBase):
         products = []
         
         try:
-            raw_data = json.loads(json_content)
+            if isinstance(raw_data, str):
+                raw_data = json.loads(raw_data)
             
             self.logger.info(f"Processing {len(raw_data)} raw records")
             
@@ -166,14 +204,14 @@ class IrlandaScraper(ScraperBase):
         
         product = {
             'name': name.strip(),
-            'brand': self.config['supplier_name'],
+            'brand': self._brand,
             'description': name.strip(),
             'price': price,
             'quantity': quantity,
             'unit': unit,
             'image': '',
             'code': code.strip() if code else '',
-            'supplierId': self.config['supplier_id']
+            'supplierId': self._supplier_id
         }
         
         return product
@@ -192,16 +230,14 @@ class IrlandaScraper(ScraperBase):
             Product dictionary or None if invalid
         """
         # Skip header lines
-        if any(skip in line.lower() for skip in ['página', 'lista', 'código', 'descripción', '═══', '───', 'cuit:', 'direc:', 'tel:']):
+        if _HEADER_SKIP_RE.search(line.lower()):
             return None
         
         # Try to match pattern: CODE DESCRIPTION PRICE
         # Price is at the end, code at the beginning
-        import re
-        
         # Match price at end (numbers with optional dots for thousands and comma for decimals)
         # Pattern: 5700.00 or 3.700,00 or 12345,00
-        price_match = re.search(r'[.\s]+(\d{1,3}(?:\.\d{3})*(?:,\d{2})?|\d+\.\d{2})\s*$', line)
+        price_match = _LINE_PRICE_RE.search(line)
         if not price_match:
             return None
         
@@ -214,10 +250,10 @@ class IrlandaScraper(ScraperBase):
         line_without_price = line[:price_match.start()].strip()
         
         # Remove dots and "..." used as fillers
-        line_without_price = re.sub(r'\.{2,}', ' ', line_without_price).strip()
+        line_without_price = _DOT_FILLER_RE.sub(' ', line_without_price).strip()
         
         # Extract code (typically at start, 5-7 digits)
-        code_match = re.match(r'^(\d{5,7})\s+', line_without_price)
+        code_match = _LINE_CODE_RE.match(line_without_price)
         code = ''
         name = line_without_price
         
@@ -226,7 +262,7 @@ class IrlandaScraper(ScraperBase):
             name = line_without_price[code_match.end():].strip()
         
         # Clean name
-        name = re.sub(r'\s{2,}', ' ', name).strip()
+        name = _MULTI_SPACE_RE.sub(' ', name).strip()
         
         if not name:
             return None
@@ -236,14 +272,14 @@ class IrlandaScraper(ScraperBase):
         
         product = {
             'name': parsed.get('name', name).strip(),
-            'brand': self.config['supplier_name'],
+            'brand': self._brand,
             'description': parsed.get('name', name).strip(),
             'price': price,
             'quantity': parsed.get('quantity', 1),
             'unit': parsed.get('unit', 'UNIT'),
             'image': '',
             'code': code,
-            'supplierId': self.config['supplier_id']
+            'supplierId': self._supplier_id
         }
         
         return product
@@ -259,18 +295,30 @@ class IrlandaScraper(ScraperBase):
         Returns:
             Found value or empty string
         """
-        for name in possible_names:
-            if name in row and row[name]:
+        row_keys = row.keys()
+        if row_keys != self._column_keys_for:
+            self._column_keys = {}
+            self._column_keys_for = set(row_keys)
+        
+        aliases = tuple(possible_names)
+        resolved = self._column_keys.get(aliases)
+        
+        if resolved is None:
+            exact = [name for name in aliases if name in row]
+            partial = [key for name in aliases for key in row_keys if name in key.lower()]
+            resolved = self._column_keys[aliases] = (exact, partial)
+        
+        exact, partial = resolved
+        
+        for name in exact:
+            if row[name]:
                 return str(row[name]).strip()
         
         # Try partial matching
-        row_keys = list(row.keys())
-        for name in possible_names:
-            for key in row_keys:
-                if name in key.lower():
-                    value = row[key]
-                    if value and str(value).strip():
-                        return str(value).strip()
+        for key in partial:
+            value = row[key]
+            if value and str(value).strip():
+                return str(value).strip()
         
         return ''
     
@@ -284,10 +332,8 @@ class IrlandaScraper(ScraperBase):
         Returns:
             Price as float
         """
-        from ..core.parser import DataParser
-        
         try:
-            price, _ = DataParser.clean_price(price_str, self.price_format)
+            price, _ = self._clean_price(price_str)
             return price
         except Exception:
             return 0.0
@@ -302,8 +348,6 @@ class IrlandaScraper(ScraperBase):
         Returns:
             Dictionary with name, quantity, unit
         """
-        from ..core.parser import DataParser
-        
         name, quantity_str, unit = DataParser.parse_product_title(title)
         
         try:
@@ -329,24 +373,7 @@ class IrlandaScraper(ScraperBase):
         """
         unit = unit.upper().strip()
         
-        unit_mapping = {
-            'KG': 'KG',
-            'KILO': 'KG',
-            'KILOS': 'KG',
-            'GR': 'G',
-            'GRAMO': 'G',
-            'GRAMOS': 'G',
-            'L': 'L',
-            'LITRO': 'L',
-            'LITROS': 'L',
-            'ML': 'ML',
-            'CC': 'ML',
-            'UN': 'UNIT',
-            'UND': 'UNIT',
-            'UNIDAD': 'UNIT'
-        }
-        
-        return unit_mapping.get(unit, 'UNIT')
+        return _UNIT_MAP.get(unit, 'UNIT')
     
     def close(self):
         """Close the PDF strategy."""
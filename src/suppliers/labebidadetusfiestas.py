@@ -1,13 +1,21 @@
 """La Bebida de Tus Fiestas scraper implementation."""
 
 from typing import List, Dict, Any, Tuple
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import re
 
+from lxml import html
+
 from ..core.scraper_base import ScraperBase
 from ..core.parser import DataParser
 from ..strategies import RequestsStrategy
+from ..utils.html_utils import HTML_PARSER, compile_selector, stripped_text
+
+# Unit patterns in title, tried in order (CC is mapped to ML)
+_CC_RE = re.compile(r'(\d+)\s*CC\b', re.IGNORECASE)
+_ML_RE = re.compile(r'(\d+)\s*ML\b', re.IGNORECASE)
+_L_RE = re.compile(r'(\d+\.?\d*)\s*(L|LITROS?)\b', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
 
 
 class LaBebidaDeTusFiestasScraper(ScraperBase):
@@ -37,9 +45,24 @@ class LaBebidaDeTusFiestasScraper(ScraperBase):
         # Get selectors from config
         self.selectors = config.get('selectors', {})
         
+        # Compile CSS selectors to XPath once; fields are matched against each product item
+        self._sel_products = compile_selector(
+            self.selectors, 'product_list', '.product-miniature', prefix='descendant-or-self::'
+        )
+        self._sel_title = compile_selector(self.selectors, 'title', '.product-title a')
+        self._sel_price = compile_selector(self.selectors, 'price', '.product-price')
+        self._sel_image = compile_selector(self.selectors, 'image', 'img')
+        
         # Initialize parser
         self.parser = DataParser()
         
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
+        
+        # Supplier info
+        self._brand = config.get('supplier_name', 'La Bebida de Tus Fiestas')
+        self._supplier_id = config.get('supplier_id', 0)
+        
         # Base URL for resolving relative paths
         self.base_url = 'https://labebidadetusfiestas.com.ar'
     
@@ -84,35 +107,35 @@ class LaBebidaDeTusFiestasScraper(ScraperBase):
         
         # Pattern 1: 'CC' (cubic centimeters) → ML
         # Examples: "1500CC", "187CC", "750CC"
-        match = re.search(r'(\d+)\s*CC\b', name, re.IGNORECASE)
+        match = _CC_RE.search(name)
         if match:
             quantity = match.group(1)
             unit = "ML"  # CC = ML (1:1 conversion)
             # Remove the matched part from name
             name = name[:match.start()] + name[match.end():]
-            name = re.sub(r'\s+', ' ', name).strip()
+            name = _WS_RE.sub(' ', name).strip()
             return (name, quantity, unit)
         
         # Pattern 2: 'ML' (milliliters)
-        match = re.search(r'(\d+)\s*ML\b', name, re.IGNORECASE)
+        match = _ML_RE.search(name)
         if match:
             quantity = match.group(1)
             unit = "ML"
             name = name[:match.start()] + name[match.end():]
-            name = re.sub(r'\s+', ' ', name).strip()
+            name = _WS_RE.sub(' ', name).strip()
             return (name, quantity, unit)
         
         # Pattern 3: 'L' or 'LITRO' or 'LITROS' (liters)
-        match = re.search(r'(\d+\.?\d*)\s*(L|LITROS?)\b', name, re.IGNORECASE)
+        match = _L_RE.search(name)
         if match:
             quantity = match.group(1)
             unit = "L"
             name = name[:match.start()] + name[match.end():]
-            name = re.sub(r'\s+', ' ', name).strip()
+            name = _WS_RE.sub(' ', name).strip()
             return (name, quantity, unit)
         
         # Clean up extra whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = _WS_RE.sub(' ', name).strip()
         
         return (name, quantity, unit)
     
@@ -127,48 +150,44 @@ class LaBebidaDeTusFiestasScraper(ScraperBase):
         Returns:
             List of product dictionaries
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        root = html.fromstring(html_content, parser=HTML_PARSER)
         products = []
         
         # Find all product items using PrestaShop class
-        product_selector = self.selectors.get('product_list', '.product-miniature')
-        product_items = soup.select(product_selector)
+        product_items = self._sel_products(root)
         
         self.logger.info(f"Found {len(product_items)} product items on page")
         
         for item in product_items:
             try:
                 # Extract title
-                title_selector = self.selectors.get('title', '.product-title a')
-                title_element = item.select_one(title_selector)
+                title_elements = self._sel_title(item)
                 
                 # Extract price
-                price_selector = self.selectors.get('price', '.product-price')
-                price_element = item.select_one(price_selector)
+                price_elements = self._sel_price(item)
                 
                 # Validate required fields
-                if not title_element or not price_element:
+                if not title_elements or not price_elements:
                     self.logger.warning("Missing title or price, skipping product")
                     continue
                 
                 # Get text content
-                title = title_element.get_text(strip=True)
-                price_text = price_element.get_text(strip=True)
+                title = stripped_text(title_elements[0])
+                price_text = stripped_text(price_elements[0])
                 
                 # Skip empty titles
                 if not title:
                     continue
                 
                 # Parse price using configured format
-                price_format = self.config.get('price_format', {})
-                price, formatted_price = self.parser.clean_price(price_text, price_format)
+                price, formatted_price = self._clean_price(price_text)
                 
                 # Extract image URL
-                image_selector = self.selectors.get('image', 'img')
-                image_element = item.select_one(image_selector)
+                image_elements = self._sel_image(item)
                 image_url = ''
                 
-                if image_element:
+                if image_elements:
+                    image_element = image_elements[0]
                     # PrestaShop uses lazy loading with data-src
                     image_url = (
                         image_element.get('data-src', '') or
@@ -188,13 +207,13 @@ class LaBebidaDeTusFiestasScraper(ScraperBase):
                 # Build product dictionary
                 product = {
                     'name': name,
-                    'brand': self.config.get('supplier_name', 'La Bebida de Tus Fiestas'),
+                    'brand': self._brand,
                     'description': title,  # Keep original title as description
                     'price': price,
                     'quantity': quantity,
                     'unit': unit,
                     'image': image_url,
-                    'supplierId': self.config.get('supplier_id', 0),
+                    'supplierId': self._supplier_id,
                 }
                 
                 products.append(product)
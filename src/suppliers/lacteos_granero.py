@@ -37,6 +37,9 @@ class LacteosGraneroScraper(ScraperBase):
         
         # Initialize parser
         self.parser = DataParser()
+        
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
     
     def get_urls(self) -> List[str]:
         """Get list of URLs to scrape from configuration."""
@@ -137,8 +140,7 @@ class LacteosGraneroScraper(ScraperBase):
         price_text = price_tag.text.strip() if price_tag else "$0"
         
         # Clean and convert price using custom format from config
-        price_format = self.config.get('price_format', {})
-        price, _ = self.parser.clean_price(price_text, price_format)
+        price, _ = self._clean_price(price_text)
         
         if price == 0.0:
             return None
@@ -267,8 +269,3 @@ class LacteosGraneroScraper(ScraperBase):
                 self.logger.debug(f"Extracted unit from description: {quantity} {unit} (from: {description[:50]}...)")
         
         return name, quantity, unit
-    
-    def __del__(self):
-        """Clean up strategy resources."""
-        if hasattr(self, 'strategy'):
-            self.strategy.close()
@@ -44,6 +44,9 @@ class LaduvalinaScraper(ScraperBase):
         # Initialize parser
         self.parser = DataParser()
         
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
+        
         # Base URL for resolving relative paths
         self.base_url = 'https://laduvalina.com.ar'
         
@@ -189,8 +192,7 @@ class LaduvalinaScraper(ScraperBase):
                     price_text = price_container.get_text(strip=True)
                 
                 # Parse price using configured format
-                price_format = self.config.get('price_format', {})
-                price, formatted_price = self.parser.clean_price(price_text, price_format)
+                price, formatted_price = self._clean_price(price_text)
                 
                 # Extract image URL
                 image_selector = self.selectors.get('image', 'img')
@@ -6,6 +6,22 @@ from ..core.scraper_base import ScraperBase
 from ..core.parser import DataParser
 from ..strategies import RequestsStrategy
 
+# Unit spellings in Piala titles (uppercased) -> standardized unit
+_UNIT_MAP = {
+    'GR': 'G',
+    'GR.': 'G',
+    'GRAMOS': 'G',
+    'KG': 'KG',
+    'K': 'KG',
+    'KG.': 'KG',
+    'KILOS': 'KG',
+    'KILOGRAMOS': 'KG',
+    'UN': 'UNIT',
+    'UN.': 'UNIT',
+    'UNIDAD': 'UNIT',
+    'UNIDADES': 'UNIT'
+}
+
 
 class PialaScraper(ScraperBase):
     """Scraper for Piala de Patria website."""
@@ -21,6 +37,9 @@ class PialaScraper(ScraperBase):
         self.selectors = config.get('selectors', {})
         self.parser = DataParser()
         
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
+        
         # Base URL for resolving relative paths
         self.base_url = 'https://www.piala.com.ar'
     
@@ -106,8 +125,7 @@ class PialaScraper(ScraperBase):
                 name, quantity, unit = self.parser.parse_product_title(title)
                 
                 # Clean and convert price using custom format from config
-                price_format = self.config.get('price_format', {})
-                price, _ = self.parser.clean_price(price_text, price_format)
+                price, _ = self._clean_price(price_text)
                 
                 # Skip if price is invalid
                 if price <= 0:
@@ -122,22 +140,7 @@ class PialaScraper(ScraperBase):
                         image_url = urljoin(self.base_url, image_url)
                 
                 # Normalize unit mapping (from TYNA scraper pattern)
-                unit_mapping = {
-                    'GR': 'G',
-                    'GR.': 'G', 
-                    'GRAMOS': 'G',
-                    'KG': 'KG',
-                    'K': 'KG',
-                    'KG.': 'KG',
-                    'KILOS': 'KG',
-                    'KILOGRAMOS': 'KG',
-                    'UN': 'UNIT',
-                    'UN.': 'UNIT',
-                    'UNIDAD': 'UNIT',
-                    'UNIDADES': 'UNIT'
-                }
-                
-                normalized_unit = unit_mapping.get(unit.upper(), unit)
+                normalized_unit = _UNIT_MAP.get(unit.upper(), unit)
                 
                 # Build product dictionary
                 product = {
@@ -159,8 +162,3 @@ class PialaScraper(ScraperBase):
         
         self.logger.info(f"Successfully extracted {len(products)} products from {url}")
         return products
-    
-    def __del__(self):
-        """Clean up resources."""
-        if hasattr(self, 'strategy'):
-            self.strategy.close()
\ No newline at end of file
@@ -9,6 +9,29 @@ from urllib.parse import urlencode
 from ..core.scraper_base import ScraperBase
 from ..core.parser import DataParser
 
+# Unit spellings in TYNA titles (uppercased, dots removed) -> standardized unit
+_UNIT_MAP = {
+    'LTS': 'L',
+    'LT': 'L',
+    'LITRO': 'L',
+    'L': 'L',
+    'LITROS': 'L',
+    'ML': 'ML',
+    'ML.': 'ML',
+    'CC': 'ML',
+    'CC.': 'ML',
+    'GR': 'G',
+    'GR.': 'G',
+    'GRAMOS': 'G',
+    'KG': 'KG',
+    'K': 'KG',
+    'KG.': 'KG',
+    'KILOS': 'KG',
+    'UN': 'UNIT',
+    'UN.': 'UNIT',
+    'U': 'UNIT'
+}
+
 
 class TYNAScraper(ScraperBase):
     """
@@ -51,6 +74,9 @@ class TYNAScraper(ScraperBase):
         # Initialize parser
         self.parser = DataParser()
         
+        # Price format
+        self._clean_price = DataParser.make_price_cleaner(self.config.get('price_format', {}))
+        
         # Create session
         self.session = requests.Session()
         self.session.headers.update(self.headers)
@@ -186,10 +212,9 @@ class TYNAScraper(ScraperBase):
         
         # Extract price (precio_final is the final price)
         price_str = data.get('precio_final', data.get('precio', '0'))
-        price_format = self.config.get('price_format', {})
         try:
             # Use clean_price for consistent price parsing
-            price, _ = self.parser.clean_price(str(price_str), price_format)
+            price, _ = self._clean_price(str(price_str))
         except (ValueError, TypeError):
             self.logger.warning(f"Invalid price for product {title}: {price_str}")
             price = 0.0
@@ -267,29 +292,7 @@ class TYNAScraper(ScraperBase):
                             unit = unit.replace('.', '')
                             
                             # Normalize units
-                            unit_mapping = {
-                                'LTS': 'L',
-                                'LT': 'L',
-                                'LITRO': 'L',
-                                'L': 'L',
-                                'LITROS': 'L',
-                                'ML': 'ML',
-                                'ML.': 'ML',
-                                'CC': 'ML',
-                                'CC.': 'ML',
-                                'GR': 'G',
-                                'GR.': 'G',
-                                'GRAMOS': 'G',
-                                'KG': 'KG',
-                                'K': 'KG',
-                                'KG.': 'KG',
-                                'KILOS': 'KG',
-                                'UN': 'UNIT',
-                                'UN.': 'UNIT',
-                                'U': 'UNIT',
-                            }
-                            
-                            result['unit'] = unit_mapping.get(unit, unit)
+                            result['unit'] = _UNIT_MAP.get(unit, unit)
                     except (ValueError, IndexError):
                         pass
                 
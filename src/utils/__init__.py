@@ -1,6 +1,10 @@
 """Utility modules."""
 
-from .text_processing import deduplicate_products, normalize_text, extract_numeric_value
+from .text_processing import deduplicate_products, dedup_stream, normalize_text, extract_numeric_value
 from .logger import setup_logger
+from .json_utils import json_loads, json_dumps_pretty, json_encode, json_dump_bytes
+from .html_utils import HTML_PARSER, HTML_PARSER_KEEP_BLANK, compile_selector, stripped_text
 
-__all__ = ['deduplicate_products', 'normalize_text', 'extract_numeric_value', 'setup_logger']
+__all__ = ['deduplicate_products', 'dedup_stream', 'normalize_text', 'extract_numeric_value', 'setup_logger',
+           'json_loads', 'json_dumps_pretty', 'json_encode', 'json_dump_bytes',
+           'HTML_PARSER', 'HTML_PARSER_KEEP_BLANK', 'compile_selector', 'stripped_text']
@@ -0,0 +1,48 @@
+"""lxml helpers shared by the static-HTML supplier scrapers."""
+
+from typing import Mapping
+
+from cssselect import HTMLTranslator
+from lxml import etree, html
+
+CSS_TRANSLATOR = HTMLTranslator()
+
+# Shared by every page. Selectors never use id lookups, so skip building libxml2's
+# ID hash table; comments and whitespace-only text nodes are dropped at parse
+# time (stripped_text strips every text node anyway) so selectors walk fewer nodes
+HTML_PARSER = html.HTMLParser(collect_ids=False, remove_blank_text=True, remove_comments=True)
+
+# Same, but keeps blank text for pages read with text_content()
+HTML_PARSER_KEEP_BLANK = html.HTMLParser(collect_ids=False, remove_comments=True)
+
+
+def compile_selector(selectors: Mapping[str, str], key: str, default: str,
+                     prefix: str = 'descendant::') -> etree.XPath:
+    """
+    Compile a configured CSS selector into a reusable XPath expression.
+    
+    Args:
+        selectors: Supplier ``selectors`` config
+        key: Selector name in ``selectors``
+        default: CSS selector used when the config has none
+        prefix: XPath axis prefix; the default matches descendants of the
+            context element, 'descendant-or-self::' also matches the element itself
+        
+    Returns:
+        Compiled XPath expression
+    """
+    css = selectors.get(key, default)
+    return etree.XPath(CSS_TRANSLATOR.css_to_xpath(css, prefix=prefix))
+
+
+def stripped_text(element: html.HtmlElement) -> str:
+    """
+    Get an element's text with each text node stripped (like ``get_text(strip=True)``).
+    
+    Args:
+        element: HTML element
+        
+    Returns:
+        Concatenated, stripped text content
+    """
+    return ''.join(text.strip() for text in element.itertext())
@@ -0,0 +1,72 @@
+"""JSON serialization helpers backed by orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from raw bytes or text.
+    
+    Args:
+        data: JSON document (e.g. ``response.content``)
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """
+    Serialize an object as 2-space indented JSON text (for logging).
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        Indented JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def json_encode(obj: Any) -> bytes:
+    """
+    Serialize an object as compact UTF-8 JSON bytes (for request bodies).
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        Compact JSON document encoded as UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def json_dump_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object as 2-space indented UTF-8 JSON bytes (for files).
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        Indented JSON document encoded as UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
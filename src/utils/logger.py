@@ -1,8 +1,11 @@
 """Logging configuration and utilities."""
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 import os
 
 
@@ -12,6 +15,9 @@ def setup_logger(name: str = 'restocompras_scraper',
     """
     Set up logger with both file and console handlers.
     
+    The handlers run on a background QueueListener thread; the logger itself
+    only enqueues records, so file and console I/O never block callers.
+    
     Args:
         name: Logger name
         log_dir: Directory for log files
@@ -53,9 +59,13 @@ def setup_logger(name: str = 'restocompras_scraper',
     console_handler.setLevel(level)
     console_handler.setFormatter(simple_formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand records to a background listener that owns the real handlers
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(QueueHandler(log_queue))
     
     logger.info(f"Logging initialized - File: {log_file}")
     
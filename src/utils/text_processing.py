@@ -1,33 +1,50 @@
 """Utility functions for text processing and data manipulation."""
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Iterator
 
 
-def deduplicate_products(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def dedup_stream(products: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
     """
-    Remove duplicate products based on (name, unit, quantity) tuple.
+    Lazily yield products, skipping duplicates by (name, unit, quantity) tuple.
+    
+    Names are compared case-insensitively (casefolded once per product),
+    matching how the API's product search treats them.
     
     Args:
-        products: List of product dictionaries
+        products: Iterable of product dictionaries
         
-    Returns:
-        List of unique products
+    Yields:
+        First occurrence of each unique product
     """
-    unique_products = {}
+    seen = set()
     
     for product in products:
         # Create unique key from name, unit, and quantity
         unique_key = (
-            product.get('name', ''),
+            (product.get('name') or '').casefold(),
             product.get('unit', 'UNIT'),
             product.get('quantity', '1')
         )
         
         # Keep first occurrence
-        if unique_key not in unique_products:
-            unique_products[unique_key] = product
+        if unique_key not in seen:
+            seen.add(unique_key)
+            yield product
+
+
+def deduplicate_products(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Remove duplicate products based on (name, unit, quantity) tuple.
+    
+    Names are compared case-insensitively; the first occurrence is kept.
     
-    return list(unique_products.values())
+    Args:
+        products: List of product dictionaries
+        
+    Returns:
+        List of unique products
+    """
+    return list(dedup_stream(products))
 
 
 def normalize_text(text: str) -> str: